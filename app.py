@@ -1,11 +1,14 @@
 import streamlit as st
-import json
-import pickle
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-import plotly.express as px
-import plotly.graph_objects as go
+
+# pandas, pyarrow and plotly are imported by the Visualizations page only, and
+# the compact JSON model is scored without sklearn, so the other pages start
+# without loading any of them
+from src.utils.app_profiling import RerunProfile, note_cache_miss, profiling_enabled
+from src.utils.batching_predictor import BatchingPredictor
+from src.utils.model_registry import LiveModel
+from src.utils.prediction import UnknownLocationError
+from src.utils.prediction_cache import PredictionCache
+from src.utils.scoring import LinearScorer
 
 # Page configuration
 st.set_page_config(
@@ -15,165 +18,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Custom CSS for better UI with sound effects, navbar, and animations
-st.markdown("""
-    <style>
-    .main {
-        max-width: 1200px;
-        padding: 2rem;
-    }
-
-    /* Page transition animations */
-    @keyframes fadeInUp {
-        from {
-            opacity: 0;
-            transform: translateY(30px);
-        }
-        to {
-            opacity: 1;
-            transform: translateY(0);
-        }
-    }
-
-    @keyframes slideInRight {
-        from {
-            opacity: 0;
-            transform: translateX(50px);
-        }
-        to {
-            opacity: 1;
-            transform: translateX(0);
-        }
-    }
-
-    @keyframes scaleIn {
-        from {
-            opacity: 0;
-            transform: scale(0.95);
-        }
-        to {
-            opacity: 1;
-            transform: scale(1);
-        }
-    }
-
-    /* Apply animations to main content */
-    .main > div {
-        animation: fadeInUp 0.6s ease-out;
-    }
-
-    .element-container {
-        animation: slideInRight 0.5s ease-out;
-    }
-
-    h1, h2, h3 {
-        animation: fadeInUp 0.7s ease-out;
-    }
-
-    .stButton>button {
-        width: 100%;
-        background-color: #4CAF50;
-        color: white;
-        height: 3em;
-        border-radius: 10px;
-        font-size: 18px;
-        font-weight: bold;
-        transition: all 0.3s ease;
-    }
-    .stButton>button:hover {
-        background-color: #45a049;
-        transform: scale(1.02);
-        box-shadow: 0 4px 15px rgba(69, 160, 73, 0.4);
-    }
-    .stButton>button:active {
-        transform: scale(0.98);
-    }
-
-    .price-box {
-        padding: 20px;
-        border-radius: 10px;
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        text-align: center;
-        margin: 20px 0;
-        animation: scaleIn 0.5s ease-out;
-    }
-
-    .info-box {
-        padding: 15px;
-        border-radius: 8px;
-        background-color: #f0f2f6;
-        margin: 10px 0;
-        color: #000000;
-        animation: fadeInUp 0.6s ease-out;
-    }
-    .info-box h4 {
-        color: #1f1f1f;
-        margin-bottom: 10px;
-    }
-    .info-box ul {
-        color: #333333;
-    }
-
-    /* Fade animation for metrics */
-    .stMetric {
-        animation: scaleIn 0.5s ease-out;
-    }
-
-    /* Smooth transitions for plotly charts */
-    .js-plotly-plot {
-        animation: fadeInUp 0.8s ease-out;
-    }
-    </style>
-
-    <script>
-    // Sound effects
-    const playSound = (type) => {
-        const sounds = {
-            click: 'data:audio/wav;base64,UklGRnoGAABXQVZFZm10IBAAAAABAAEAQB8AAEAfAAABAAgAZGF0YQoGAACBhYqFbF1fdJivrJBhNjVgodDbq2EcBj+a2/LDciUFLIHO8tiJNwgZaLvt559NEAxQp+PwtmMcBjiR1/LMeSwFJHfH8N2QQAoUXrTp66hVFApGn+DyvmwhBSuBzvLZiTUIGWi77eeeTRAKT6fj77RhGgU0jNXwzn0vBSh+zPLaizsKF2G36+mhUhELTKXh8rNfGgU0i9Twz38xBSh+zPLaizsKF2G36+mhUhELTKXh8rNfGgU0i9Twz38xBSh+',
-            hover: 'data:audio/wav;base64,UklGRhIAAABXQVZFZm10IBAAAAABAAEARKwAAIhYAQACABAAZGF0YZAAAAAAQEZMU05UWVxdXVxZVlBKQ0A+Oz45ODc3Nzg5Ozw+QEREREVFREVFRERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERERE',
-            expand: 'data:audio/wav;base64,UklGRhQAAABXQVZFZm10IBAAAAABAAEAIlYAAESsAAACABAAZGF0YQAA'
-        };
-        const audio = new Audio(sounds[type] || sounds.click);
-        audio.volume = 0.3;
-        audio.play().catch(e => console.log('Audio play failed:', e));
-    };
-
-    // Add click sound to buttons
-    document.addEventListener('click', (e) => {
-        if (e.target.tagName === 'BUTTON' || e.target.closest('button')) {
-            playSound('click');
-        }
-    });
-
-    // Add hover sound
-    document.addEventListener('mouseover', (e) => {
-        if (e.target.tagName === 'BUTTON' || e.target.closest('button')) {
-            playSound('hover');
-        }
-    });
-
-    // Add expand sound for expanders
-    const observer = new MutationObserver((mutations) => {
-        mutations.forEach((mutation) => {
-            if (mutation.target.classList && mutation.target.classList.contains('streamlit-expanderHeader')) {
-                playSound('expand');
-            }
-        });
-    });
-
-    observer.observe(document.body, {
-        attributes: true,
-        subtree: true,
-        attributeFilter: ['class']
-    });
-    </script>
-""", unsafe_allow_html=True)
+# Stylesheet served once from static/ (see .streamlit/config.toml); the
+# browser caches it, so each rerun only sends this one-line import
+st.markdown('<style>@import url("app/static/app.css");</style>', unsafe_allow_html=True)
 
 # Initialize session state for navigation
 if 'page' not in st.session_state:
     st.session_state.page = 'Home'
 
+# Opt-in profiling: APP_PROFILE=1 or ?profile=1
+profile = RerunProfile(st.session_state.page, profiling_enabled(st.query_params))
+
 # Navigation buttons
 col1, col2, col3, col4 = st.columns(4)
 with col1:
@@ -198,62 +53,65 @@ st.markdown("---")
 # Load model and artifacts
 @st.cache_resource
 def load_saved_artifacts():
-    """Load the trained model and location data"""
-    with open("./src/models/artifacts/columns.json", 'r') as f:
-        data_columns = json.load(f)['data_columns']
-        locations = data_columns[4:]
+    """Current model version, swapped in the background when a new one is published"""
+    note_cache_miss('load_saved_artifacts')
+    return LiveModel()
 
-    with open('./src/models/artifacts/bangalore_home_prices_model.pickle', 'rb') as f:
-        model = pickle.load(f)
+@st.cache_resource
+def get_prediction_cache():
+    """LRU cache of predictions shared by all sessions"""
+    note_cache_miss('get_prediction_cache')
+    return PredictionCache()
 
-    return model, data_columns, locations
+@st.cache_resource
+def get_batching_predictor():
+    """Coalesces concurrent sessions' cache misses into batched predict calls"""
+    note_cache_miss('get_batching_predictor')
+    return BatchingPredictor(load_saved_artifacts())
 
-def get_estimated_price(location, sqft, bhk, bath, balcony, model, data_columns):
+def get_estimated_price(location, sqft, bhk, bath, balcony, scorer):
     """Predict house price based on inputs"""
-    try:
-        loc_index = data_columns.index(location.lower())
-    except:
-        loc_index = -1
-
-    x = np.zeros(len(data_columns))
-    x[0] = sqft
-    x[1] = bath
-    x[2] = balcony
-    x[3] = bhk
-
-    if loc_index >= 0:
-        x[loc_index] = 1
-
-    return round(model.predict([x])[0], 2)
+    with profile.stage('get_prediction_cache', cached=True):
+        cache = get_prediction_cache()
+    # The closed-form scorer is faster than any hand-off; batch the sklearn path only
+    if not isinstance(scorer, LinearScorer):
+        with profile.stage('get_batching_predictor', cached=True):
+            scorer = get_batching_predictor().bind(scorer)
+    return cache.get_price(scorer, location, sqft, bhk, bath, balcony)
 
 # Load dataset for visualizations
-@st.cache_data
-def load_data():
-    df = pd.read_csv("./data/Bengaluru_House_Data.csv")
-    df = df.dropna()
-    df['bhk'] = df['size'].apply(lambda x: int(x.split()[0]) if isinstance(x, str) else 0)
-
-    def convert_sqft_to_num(x):
-        if isinstance(x, str):
-            tokens = x.split('-')
-            if len(tokens) == 2:
-                return (float(tokens[0]) + float(tokens[1])) / 2
-            try:
-                return float(x)
-            except:
-                return None
-        return x
-
-    df['total_sqft'] = df['total_sqft'].apply(convert_sqft_to_num)
-    df = df[df['total_sqft'].notna()]
-    df['price_per_sqft'] = df['price'] * 100000 / df['total_sqft']
-    df.location = df.location.apply(lambda x: x.strip() if isinstance(x, str) else x)
-
-    return df
+# Dataset-keyed resources keep only the latest CSV version, so a data
+# refresh replaces them instead of adding another copy
+@st.cache_resource(max_entries=1)
+def load_data(dataset_digest):
+    """Cleaned listings keyed by the CSV hash, shared read-only across sessions"""
+    note_cache_miss('load_data')
+    from src.utils.dataset_cache import load_cleaned_dataset
+    return load_cleaned_dataset(digest=dataset_digest)
+
+@st.cache_resource(max_entries=1)
+def load_aggregates(dataset_digest):
+    """Visualization tables built once per dataset version"""
+    note_cache_miss('load_aggregates')
+    from src.utils.viz_aggregates import build_aggregates
+    with profile.stage('load_data', cached=True):
+        df = load_data(dataset_digest)
+    return build_aggregates(df)
+
+@st.cache_resource(max_entries=1)
+def load_comparables(dataset_digest):
+    """Per-location nearest-listing index built once per dataset version"""
+    note_cache_miss('load_comparables')
+    from src.utils.comparables import ComparablesIndex
+    with profile.stage('load_data', cached=True):
+        df = load_data(dataset_digest)
+    return ComparablesIndex(df)
 
 # Load artifacts
 try:
-    model, data_columns, locations = load_saved_artifacts()
+    with profile.stage('load_saved_artifacts', cached=True):
+        live_model = load_saved_artifacts()
+        scorer, locations = live_model.current()
 
     # PAGE: HOME
     if st.session_state.page == 'Home':
@@ -294,6 +152,7 @@ try:
     elif st.session_state.page == 'Predict':
         st.title("🔮 Price Prediction")
         st.markdown("### Enter property details to get an estimated price")
+        st.caption(f"Model version: {live_model.version or 'bundled'}")
 
         st.subheader("📋 Enter Property Details")
 
@@ -340,23 +199,29 @@ try:
         st.markdown("<br>", unsafe_allow_html=True)
         if st.button("🔮 Predict Price"):
             with st.spinner("Calculating price..."):
-                predicted_price = get_estimated_price(
-                    location, total_sqft, bhk, bath, balcony, model, data_columns
-                )
-
-                st.session_state['show_metrics'] = True
-                st.session_state['predicted_price'] = predicted_price
-                st.session_state['total_sqft'] = total_sqft
-                st.session_state['bhk'] = bhk
-                st.session_state['bath'] = bath
-
-                st.markdown(f"""
-                    <div class="price-box">
-                        <h2>Estimated Price</h2>
-                        <h1>₹ {predicted_price:,.2f} Lakhs</h1>
-                        <p>≈ ₹ {predicted_price * 100000:,.0f}</p>
-                    </div>
-                """, unsafe_allow_html=True)
+                try:
+                    with profile.stage('predict'):
+                        predicted_price = get_estimated_price(
+                            location, total_sqft, bhk, bath, balcony, scorer
+                        )
+                except UnknownLocationError as e:
+                    st.error(str(e))
+                    st.session_state['show_metrics'] = False
+                else:
+                    st.session_state['show_metrics'] = True
+                    st.session_state['predicted_price'] = predicted_price
+                    st.session_state['predicted_location'] = location
+                    st.session_state['total_sqft'] = total_sqft
+                    st.session_state['bhk'] = bhk
+                    st.session_state['bath'] = bath
+
+                    st.markdown(f"""
+                        <div class="price-box">
+                            <h2>Estimated Price</h2>
+                            <h1>₹ {predicted_price:,.2f} Lakhs</h1>
+                            <p>≈ ₹ {predicted_price * 100000:,.0f}</p>
+                        </div>
+                    """, unsafe_allow_html=True)
 
         if st.session_state.get('show_metrics', False):
             st.markdown("---")
@@ -372,95 +237,228 @@ try:
             with metrics_col3:
                 st.metric("🏠 Configuration", f"{st.session_state['bhk']} BHK, {st.session_state['bath']} Bath")
 
+            if st.toggle("🏘️ Comparable listings", key="comparables", help="Closest real listings in the same location"):
+                from src.utils.dataset_cache import csv_digest
+
+                with profile.stage('csv_digest'):
+                    dataset_digest = csv_digest()
+                with profile.stage('load_comparables', cached=True):
+                    comparables = load_comparables(dataset_digest)
+                with profile.stage('query_comparables'):
+                    listings = comparables.query(
+                        st.session_state['predicted_location'], st.session_state['total_sqft'],
+                        st.session_state['bhk'], st.session_state['bath'], price_per_sqft
+                    )
+                if listings:
+                    st.dataframe(
+                        [{
+                            'Size': listing['size'],
+                            'Area (sq ft)': f"{listing['total_sqft']:,.0f}",
+                            'Bath': int(listing['bath']),
+                            'Balcony': int(listing['balcony']),
+                            'Price (Lakhs)': listing['price'],
+                            'Price per sq ft (₹)': f"{listing['price_per_sqft']:,.0f}",
+                        } for listing in listings],
+                        hide_index=True, use_container_width=True
+                    )
+                else:
+                    st.info(f"No listings in {st.session_state['predicted_location']} to compare with.")
+
+        st.markdown("---")
+        if st.toggle("📈 What-if explorer", key="what_if", help="Price every size and configuration for this location"):
+            import plotly.graph_objects as go
+
+            from src.utils.price_explorer import WHAT_IF_BATH, WHAT_IF_BHK, WHAT_IF_SQFT, price_grid
+
+            with profile.stage('what_if_grid'):
+                grid = price_grid(scorer, location, balcony)
+
+            what_if_tab1, what_if_tab2 = st.tabs(["📈 Price vs Area", "🔥 BHK × Bathrooms"])
+
+            with what_if_tab1:
+                with profile.stage('figure.what_if_curves'):
+                    fig_curves = go.Figure()
+                    bath_row = min(bath, WHAT_IF_BATH[-1]) - WHAT_IF_BATH[0]
+                    for bhk_row, bhk_value in enumerate(WHAT_IF_BHK):
+                        fig_curves.add_trace(go.Scatter(
+                            x=WHAT_IF_SQFT, y=grid[bhk_row, bath_row],
+                            mode='lines',
+                            name=f'{bhk_value} BHK'
+                        ))
+                    fig_curves.update_layout(
+                        xaxis_title="Total Square Feet Area",
+                        yaxis_title="Price (Lakhs)",
+                        title=f"Price vs Area - {location}, {WHAT_IF_BATH[bath_row]} Bath",
+                        hovermode='x unified',
+                        height=500
+                    )
+                with profile.stage('chart.what_if_curves'):
+                    st.plotly_chart(fig_curves, use_container_width=True)
+
+            with what_if_tab2:
+                with profile.stage('figure.what_if_heatmap'):
+                    sqft_col = int(abs(WHAT_IF_SQFT - total_sqft).argmin())
+                    fig_heatmap = go.Figure(go.Heatmap(
+                        x=[f'{value} Bath' for value in WHAT_IF_BATH],
+                        y=[f'{value} BHK' for value in WHAT_IF_BHK],
+                        z=grid[:, :, sqft_col],
+                        colorscale='Viridis',
+                        texttemplate="%{z:,.1f}",
+                        hovertemplate="%{y}, %{x}: ₹ %{z:,.2f} Lakhs<extra></extra>"
+                    ))
+                    fig_heatmap.update_layout(
+                        title=f"Price (Lakhs) - {location}, {WHAT_IF_SQFT[sqft_col]:,} sq ft",
+                        height=500
+                    )
+                with profile.stage('chart.what_if_heatmap'):
+                    st.plotly_chart(fig_heatmap, use_container_width=True)
+
+        if st.toggle("📍 Compare locations", key="rank_locations", help="Price this property in every location"):
+            from src.utils.price_explorer import rank_locations
+
+            rank_col1, rank_col2 = st.columns(2)
+            with rank_col1:
+                budget = st.number_input(
+                    "💰 Budget (Lakhs, 0 for no limit)",
+                    min_value=0.0,
+                    value=0.0,
+                    step=10.0,
+                    help="Only show locations priced within this budget"
+                )
+            with rank_col2:
+                top_n = st.slider("📋 Locations to show", min_value=5, max_value=25, value=10)
+
+            with profile.stage('rank_locations'):
+                ranking = rank_locations(scorer, total_sqft, bhk, bath, balcony, max_price=budget or None)
+
+            st.markdown(
+                f"**{len(ranking)}** of {len(locations)} locations for a {bhk} BHK, {bath} Bath, "
+                f"{total_sqft:,} sq ft property" + (f" within ₹ {budget:,.0f} Lakhs" if budget else "")
+            )
+            if len(ranking):
+                cheapest_col, priciest_col = st.columns(2)
+                with cheapest_col:
+                    st.markdown("##### 🔽 Cheapest")
+                    st.dataframe(
+                        [{'Location': name, 'Price (Lakhs)': round(price, 2)} for name, price in ranking.cheapest(top_n)],
+                        hide_index=True, use_container_width=True
+                    )
+                with priciest_col:
+                    st.markdown("##### 🔼 Most expensive")
+                    st.dataframe(
+                        [{'Location': name, 'Price (Lakhs)': round(price, 2)} for name, price in ranking.priciest(top_n)],
+                        hide_index=True, use_container_width=True
+                    )
+
     # PAGE: VISUALIZATIONS
     elif st.session_state.page == 'Visualizations':
+        import plotly.express as px
+        import plotly.graph_objects as go
+
+        from src.utils.dataset_cache import csv_digest
+        from src.utils.viz_aggregates import get_bhk_count, get_bhk_points
+
         st.title("📊 Data Visualizations")
         st.markdown("### Explore the Bangalore housing dataset")
 
-        df_viz = load_data()
+        with profile.stage('csv_digest'):
+            dataset_digest = csv_digest()
+        with profile.stage('load_aggregates', cached=True):
+            viz = load_aggregates(dataset_digest)
 
         viz_tab1, viz_tab2, viz_tab3 = st.tabs(["📈 Price Comparison", "💰 Price Distribution", "🚿 Bathroom Analysis"])
 
         with viz_tab1:
             st.markdown("### 2 BHK vs 3 BHK Price Comparison by Location")
 
-            top_locations = df_viz['location'].value_counts().head(20).index.tolist()
-            selected_location = st.selectbox("Select Location for Comparison", top_locations, key="scatter_location")
-
-            bhk2 = df_viz[(df_viz.location == selected_location) & (df_viz.bhk == 2)]
-            bhk3 = df_viz[(df_viz.location == selected_location) & (df_viz.bhk == 3)]
-
-            fig1 = go.Figure()
-            fig1.add_trace(go.Scatter(
-                x=bhk2['total_sqft'], y=bhk2['price'],
-                mode='markers',
-                name='2 BHK',
-                marker=dict(color='#4A90E2', size=8)
-            ))
-            fig1.add_trace(go.Scatter(
-                x=bhk3['total_sqft'], y=bhk3['price'],
-                mode='markers',
-                name='3 BHK',
-                marker=dict(color='#50C878', size=10, symbol='diamond')
-            ))
-            fig1.update_layout(
-                xaxis_title="Total Square Feet Area",
-                yaxis_title="Price (Lakhs)",
-                title=f"Price vs Area - {selected_location}",
-                hovermode='closest',
-                height=500
-            )
-            st.plotly_chart(fig1, use_container_width=True)
+            selected_location = st.selectbox("Select Location for Comparison", viz['top_locations'], key="scatter_location")
+
+            bhk2 = get_bhk_points(viz, selected_location, 2)
+            bhk3 = get_bhk_points(viz, selected_location, 3)
+
+            # WebGL traces; groups above MAX_SCATTER_POINTS arrive downsampled
+            with profile.stage('figure.price_comparison'):
+                fig1 = go.Figure()
+                fig1.add_trace(go.Scattergl(
+                    x=bhk2['total_sqft'], y=bhk2['price'],
+                    mode='markers',
+                    name='2 BHK',
+                    marker=dict(color='#4A90E2', size=8)
+                ))
+                fig1.add_trace(go.Scattergl(
+                    x=bhk3['total_sqft'], y=bhk3['price'],
+                    mode='markers',
+                    name='3 BHK',
+                    marker=dict(color='#50C878', size=10, symbol='diamond')
+                ))
+                fig1.update_layout(
+                    xaxis_title="Total Square Feet Area",
+                    yaxis_title="Price (Lakhs)",
+                    title=f"Price vs Area - {selected_location}",
+                    hovermode='closest',
+                    height=500
+                )
+            with profile.stage('chart.price_comparison'):
+                st.plotly_chart(fig1, use_container_width=True)
+
+            n_listings = get_bhk_count(viz, selected_location, 2) + get_bhk_count(viz, selected_location, 3)
+            if len(bhk2) + len(bhk3) < n_listings:
+                st.caption(f"Showing a random sample of {len(bhk2) + len(bhk3):,} of {n_listings:,} listings")
 
         with viz_tab2:
             st.markdown("### Price per Square Feet Distribution")
 
-            price_filtered = df_viz[df_viz['price_per_sqft'] < df_viz['price_per_sqft'].quantile(0.95)]
-
-            fig2 = px.histogram(
-                price_filtered,
-                x='price_per_sqft',
-                nbins=50,
-                title='Distribution of Price per Square Feet',
-                labels={'price_per_sqft': 'Price per Sq Ft (₹)'},
-                color_discrete_sequence=['#667eea']
-            )
-            fig2.update_layout(
-                xaxis_title="Price per Square Feet (₹)",
-                yaxis_title="Count",
-                showlegend=False,
-                height=500
-            )
-            st.plotly_chart(fig2, use_container_width=True)
+            pps_histogram = viz['pps_histogram']
+
+            with profile.stage('figure.price_distribution'):
+                fig2 = go.Figure(go.Bar(
+                    x=(pps_histogram['bin_start'] + pps_histogram['bin_end']) / 2,
+                    y=pps_histogram['count'],
+                    width=pps_histogram['bin_end'] - pps_histogram['bin_start'],
+                    marker=dict(color='#667eea'),
+                    hovertemplate="Price per Sq Ft (₹): %{x:,.0f}<br>Count: %{y}<extra></extra>"
+                ))
+                fig2.update_layout(
+                    title='Distribution of Price per Square Feet',
+                    xaxis_title="Price per Square Feet (₹)",
+                    yaxis_title="Count",
+                    showlegend=False,
+                    bargap=0,
+                    height=500
+                )
+            with profile.stage('chart.price_distribution'):
+                st.plotly_chart(fig2, use_container_width=True)
 
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Average", f"₹ {df_viz['price_per_sqft'].mean():,.0f}")
+                st.metric("Average", f"₹ {viz['pps_summary']['mean']:,.0f}")
             with col2:
-                st.metric("Median", f"₹ {df_viz['price_per_sqft'].median():,.0f}")
+                st.metric("Median", f"₹ {viz['pps_summary']['median']:,.0f}")
             with col3:
-                st.metric("Std Dev", f"₹ {df_viz['price_per_sqft'].std():,.0f}")
+                st.metric("Std Dev", f"₹ {viz['pps_summary']['std']:,.0f}")
 
         with viz_tab3:
             st.markdown("### Number of Bathrooms Distribution")
 
-            bath_counts = df_viz['bath'].value_counts().sort_index()
+            bath_counts = viz['bath_counts']
 
-            fig3 = px.bar(
-                x=bath_counts.index,
-                y=bath_counts.values,
-                labels={'x': 'Number of Bathrooms', 'y': 'Count'},
-                title='Distribution of Bathrooms',
-                color=bath_counts.values,
-                color_continuous_scale='Viridis'
-            )
-            fig3.update_layout(
-                xaxis_title="Number of Bathrooms",
-                yaxis_title="Count",
-                showlegend=False,
-                height=500
-            )
-            st.plotly_chart(fig3, use_container_width=True)
+            with profile.stage('figure.bathroom_distribution'):
+                fig3 = px.bar(
+                    x=bath_counts.index,
+                    y=bath_counts.values,
+                    labels={'x': 'Number of Bathrooms', 'y': 'Count'},
+                    title='Distribution of Bathrooms',
+                    color=bath_counts.values,
+                    color_continuous_scale='Viridis'
+                )
+                fig3.update_layout(
+                    xaxis_title="Number of Bathrooms",
+                    yaxis_title="Count",
+                    showlegend=False,
+                    height=500
+                )
+            with profile.stage('chart.bathroom_distribution'):
+                st.plotly_chart(fig3, use_container_width=True)
 
     # PAGE: ABOUT
     elif st.session_state.page == 'About':
@@ -509,3 +507,10 @@ try:
 except Exception as e:
     st.error(f"Error loading model: {str(e)}")
     st.info("Please ensure the artifacts folder contains the required model and columns files.")
+
+# Profiling panel and log
+if profile.enabled:
+    profile_record = profile.finish()
+    RerunProfile.write(profile_record)
+    with st.expander(f"⏱️ Profile: {profile_record['total_ms']:,.1f} ms this rerun"):
+        st.dataframe(profile_record['stages'], hide_index=True, use_container_width=True)
@@ -0,0 +1,72 @@
+"""Benchmark the Streamlit app's cold start: imports and first render per page.
+
+Each page is rendered in a fresh interpreter with streamlit's AppTest, so
+the first run pays for every import and artifact load the page triggers.
+Reports the time to import streamlit, the first render, a second (warm)
+render, the HTML/markdown bytes the page sends per rerun and which heavy
+libraries the page ended up importing.
+
+    python -m benchmarks.bench_app_startup --repeat 3
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+PAGES = ('Home', 'Predict', 'Visualizations', 'About')
+HEAVY_MODULES = ('pandas', 'pyarrow', 'plotly.express', 'matplotlib', 'sklearn')
+
+RENDER = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+at = AppTest.from_file({app!r}, default_timeout=120)
+at.session_state['page'] = {page!r}
+at.run()
+first = time.perf_counter()
+at.run()
+second = time.perf_counter()
+sent = sum(len(m.value) for m in at.markdown) + sum(len(h.proto.body) for h in at.get('html'))
+print(json.dumps({{
+    'import_s': imported - start,
+    'first_render_s': first - imported,
+    'warm_render_s': second - first,
+    'markup_bytes': sent,
+    'errors': len(at.exception) + len(at.error),
+    'heavy_modules': [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def render_page(app, page):
+    """Cold-start measurements of one page in a fresh interpreter"""
+    code = RENDER.format(app=str(app), page=page, heavy=HEAVY_MODULES)
+    result = subprocess.run([sys.executable, '-W', 'ignore', '-c', code], check=True,
+                            capture_output=True, text=True, cwd=ROOT_DIR)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark app import and first-render time")
+    parser.add_argument('--app', type=Path, default=ROOT_DIR / 'app.py', help="Streamlit script to render")
+    parser.add_argument('--repeat', type=int, default=3, help="fresh interpreters per page")
+    args = parser.parse_args(argv)
+
+    print(f"{'page':15s} {'import s':>9s} {'first s':>9s} {'warm s':>9s} {'markup B':>9s}  heavy modules")
+    for page in PAGES:
+        runs = [render_page(args.app, page) for _ in range(args.repeat)]
+        median = {key: statistics.median(r[key] for r in runs)
+                  for key in ('import_s', 'first_render_s', 'warm_render_s')}
+        last = runs[-1]
+        errors = '  ERRORS' if last['errors'] else ''
+        print(f"{page:15s} {median['import_s']:9.3f} {median['first_render_s']:9.3f} "
+              f"{median['warm_render_s']:9.3f} {last['markup_bytes']:9d}  "
+              f"{', '.join(last['heavy_modules']) or '-'}{errors}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Benchmark single predictions from many threads, direct versus micro-batched.
+
+Each of N caller threads prices its share of the requests one at a time,
+either calling scorer.predict_one itself or going through a
+BatchingPredictor. Both the closed-form LinearScorer and the sklearn path
+(SklearnScorer over the pickled model) are measured. Before timing, it
+checks that bad requests fail on their own without stalling the others.
+
+    python -m benchmarks.bench_batching --requests 20000
+"""
+import argparse
+import threading
+import time
+
+from src.utils.batching_predictor import MAX_BATCH, MAX_WAIT, BatchingPredictor
+from src.utils.model_registry import resolve_artifacts_dir
+from src.utils.prediction import load_artifacts
+from src.utils.scoring import LinearScorer, SklearnScorer
+
+CONCURRENCY = (1, 2, 4, 8, 16, 32, 64)
+PROPERTY = ('Whitefield', 1200, 2, 2, 1)
+
+
+def run_callers(predict_one, n_threads, n_requests):
+    """Requests per second with n_threads each making n_requests / n_threads calls"""
+    per_thread = n_requests // n_threads
+    barrier = threading.Barrier(n_threads + 1)
+
+    def caller():
+        barrier.wait()
+        for _ in range(per_thread):
+            predict_one(*PROPERTY)
+
+    threads = [threading.Thread(target=caller) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return per_thread * n_threads / (time.perf_counter() - start)
+
+
+BAD_REQUESTS = (('Whitefield', 'abc', 2, 2, 1), ('Whitefield', None, 2, 2, 1), ('Nowhere', 1200, 2, 2, 1))
+
+
+def check_bad_requests(scorer):
+    """Bad requests fail alone, in a batch with good ones and before later ones"""
+    # A wide window so the concurrent requests below share one batch
+    batcher = BatchingPredictor(scorer, max_wait=0.05)
+    outcomes = {}
+
+    def call(key, request):
+        try:
+            outcomes[key] = batcher.predict_one(*request, timeout=5)
+        except Exception as e:
+            outcomes[key] = e
+
+    try:
+        requests = [PROPERTY, *BAD_REQUESTS, PROPERTY]
+        threads = [threading.Thread(target=call, args=(i, request)) for i, request in enumerate(requests)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        call('after', PROPERTY)
+    finally:
+        batcher.close()
+
+    expected = scorer.predict_one(*PROPERTY)
+    for key, request in [*enumerate(requests), ('after', PROPERTY)]:
+        outcome = outcomes[key]
+        if isinstance(outcome, TimeoutError):
+            raise SystemExit(f"{request} was never answered by the batching worker")
+        if request is PROPERTY and outcome != expected:
+            raise SystemExit(f"{request} got {outcome!r} instead of {expected}")
+        if request is not PROPERTY and not isinstance(outcome, Exception):
+            raise SystemExit(f"{request} was priced instead of failing")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark micro-batched predictions under concurrency")
+    parser.add_argument('--requests', type=int, default=20_000, help="predictions per measurement")
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH, help="largest batch")
+    parser.add_argument('--max-wait', type=float, default=MAX_WAIT, help="seconds to wait for a batch to fill")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=list(CONCURRENCY), help="caller threads")
+    args = parser.parse_args(argv)
+
+    model, data_columns, _, location_index = load_artifacts(resolve_artifacts_dir())
+    scorers = {
+        'linear': LinearScorer.from_model(model, data_columns, location_index),
+        'sklearn': SklearnScorer(model, data_columns, location_index),
+    }
+
+    for scorer in scorers.values():
+        check_bad_requests(scorer)
+
+    print(f"{'scorer':8s} {'threads':>7s} {'direct/s':>10s} {'batched/s':>10s} {'speedup':>8s} "
+          f"{'mean batch':>10s} {'wait p50 ms':>11s} {'wait p99 ms':>11s}")
+    for name, scorer in scorers.items():
+        # The sklearn path is ~100x slower per call; keep its runs comparable in time
+        n_requests = args.requests if name == 'linear' else args.requests // 10
+        for n_threads in args.concurrency:
+            direct = run_callers(scorer.predict_one, n_threads, n_requests)
+            batcher = BatchingPredictor(scorer, args.max_batch, args.max_wait)
+            batched = run_callers(batcher.predict_one, n_threads, n_requests)
+            stats = batcher.stats()
+            batcher.close()
+            print(f"{name:8s} {n_threads:7d} {direct:10,.0f} {batched:10,.0f} {batched / direct:8.2f} "
+                  f"{stats['mean_batch_size']:10.1f} {stats['queue_wait_ms_p50']:11.3f} "
+                  f"{stats['queue_wait_ms_p99']:11.3f}")
+
+
+if __name__ == '__main__':
+    main()
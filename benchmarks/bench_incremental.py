@@ -0,0 +1,73 @@
+"""Benchmark incremental retraining against a full retrain.
+
+The listings CSV is split into a history file and daily batches of appended
+rows. After every batch the training state is updated, and at the end the
+coefficients are compared with a full retrain on the combined file.
+
+    python -m benchmarks.bench_incremental --batches 10 --batch-rows 100
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.incremental_training import TrainingState
+from src.utils.linear_fit import fit_linear_regression
+from src.utils.retrain_model import DATA_PATH, prepare_training_frame, sparse_design_matrix
+
+
+def full_retrain(csv_path):
+    """(model, feature_names) fit on every retained row, the way retrain_model.py cleans them"""
+    df10 = prepare_training_frame(pd.read_csv(csv_path))
+    X, feature_names = sparse_design_matrix(df10)
+    return fit_linear_regression(X, df10.price), feature_names
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark incremental retraining")
+    parser.add_argument('--csv', default=DATA_PATH, help="source CSV")
+    parser.add_argument('--batches', type=int, default=10, help="appended batches")
+    parser.add_argument('--batch-rows', type=int, default=100, help="rows per appended batch")
+    args = parser.parse_args(argv)
+
+    lines = Path(args.csv).read_bytes().splitlines(keepends=True)
+    n_appended = args.batches * args.batch_rows
+    history, appended = lines[:-n_appended], lines[-n_appended:]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / 'listings.csv'
+        csv_path.write_bytes(b''.join(history))
+
+        state = TrainingState()
+        start = time.perf_counter()
+        state.update(csv_path)
+        state.fit()
+        print(f"initial build ({len(history) - 1} rows): {time.perf_counter() - start:.3f}s")
+
+        update_times = []
+        for i in range(args.batches):
+            with open(csv_path, 'ab') as f:
+                f.writelines(appended[i * args.batch_rows:(i + 1) * args.batch_rows])
+            start = time.perf_counter()
+            state.update(csv_path)
+            model, feature_names = state.fit()
+            update_times.append(time.perf_counter() - start)
+        print(f"incremental update ({args.batch_rows} rows): median {np.median(update_times):.3f}s "
+              f"max {max(update_times):.3f}s")
+
+        start = time.perf_counter()
+        full_model, full_names = full_retrain(csv_path)
+        print(f"full retrain ({len(lines) - 1} rows): {time.perf_counter() - start:.3f}s")
+
+    if feature_names != full_names:
+        raise SystemExit("feature columns differ from the full retrain")
+    print(f"retained rows: {state.n_samples}, features: {len(feature_names)}")
+    print(f"max |coef diff|: {np.abs(model.coef_ - full_model.coef_).max():.2e}, "
+          f"intercept diff: {abs(model.intercept_ - full_model.intercept_):.2e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""Benchmark CSV cleaning: the old row-wise apply versus preprocessing.clean_listings.
+
+Usage (from the repository root):
+
+    python -m benchmarks.bench_preprocessing --rows 1000000
+"""
+import argparse
+import time
+
+from benchmarks.synthetic import make_synthetic_listings
+from src.utils.preprocessing import clean_listings
+
+
+def clean_listings_rowwise(df):
+    """The per-row apply cleaning load_data used before clean_listings"""
+    df = df.copy()
+    df['bhk'] = df['size'].apply(lambda x: int(x.split()[0]) if isinstance(x, str) else 0)
+
+    def convert_sqft_to_num(x):
+        if isinstance(x, str):
+            tokens = x.split('-')
+            if len(tokens) == 2:
+                return (float(tokens[0]) + float(tokens[1])) / 2
+            try:
+                return float(x)
+            except ValueError:
+                return None
+        return x
+
+    df['total_sqft'] = df['total_sqft'].apply(convert_sqft_to_num)
+    df['price_per_sqft'] = df['price'] * 100000 / df['total_sqft']
+    df['location'] = df['location'].apply(lambda x: x.strip() if isinstance(x, str) else x)
+    return df
+
+
+def best_time(func, df, repeat):
+    """Best wall time of func(df) over repeat runs"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(df)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark listing cleaning")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="synthetic rows to clean")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per implementation")
+    args = parser.parse_args(argv)
+
+    df = make_synthetic_listings(args.rows)
+    print(f"Cleaning {len(df):,} rows (best of {args.repeat})")
+
+    rowwise = best_time(clean_listings_rowwise, df, args.repeat)
+    vectorized = best_time(clean_listings, df, args.repeat)
+
+    print(f"row-wise apply:  {rowwise:8.3f}s  {len(df) / rowwise:12,.0f} rows/s")
+    print(f"vectorized:      {vectorized:8.3f}s  {len(df) / vectorized:12,.0f} rows/s")
+    print(f"speedup:         {rowwise / vectorized:8.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark model startup: unpickling with sklearn versus the compact JSON model.
+
+Each variant runs in a fresh interpreter, from import to first prediction.
+
+    python -m benchmarks.bench_startup --repeat 5
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+VARIANTS = {
+    'pickle (sklearn)': (
+        "from src.utils.model_registry import resolve_artifacts_dir\n"
+        "from src.utils.prediction import load_artifacts\n"
+        "from src.utils.scoring import LinearScorer\n"
+        "model, data_columns, _, location_index = load_artifacts(resolve_artifacts_dir())\n"
+        "LinearScorer.from_model(model, data_columns, location_index).predict_one('Whitefield', 1200, 2, 2, 1)\n"
+    ),
+    'compact json': (
+        "from src.utils.model_registry import resolve_artifacts_dir\n"
+        "from src.utils.scoring import MODEL_FILE, LinearScorer\n"
+        "LinearScorer.load(resolve_artifacts_dir() / MODEL_FILE).predict_one('Whitefield', 1200, 2, 2, 1)\n"
+    ),
+}
+
+
+def time_startup(code):
+    """Wall time of a fresh interpreter running code"""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-W', 'ignore', '-c', code], check=True)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark model startup time")
+    parser.add_argument('--repeat', type=int, default=5, help="fresh interpreters per variant")
+    args = parser.parse_args(argv)
+
+    for name, code in VARIANTS.items():
+        times = [time_startup(code) for _ in range(args.repeat)]
+        print(f"{name:18s} median {statistics.median(times):6.3f}s  min {min(times):6.3f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark peak memory of whole-file versus chunked ingestion.
+
+A synthetic listings CSV is written to a temporary directory. Each variant
+runs in a fresh interpreter, which reports its own peak resident set size.
+
+    python -m benchmarks.bench_streaming --rows 2000000
+"""
+import argparse
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PEAK_RSS = (
+    "import resource\n"
+    "print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // 1024)\n"
+)
+
+VARIANTS = {
+    'train, whole file': (
+        "import numpy as np, pandas as pd\n"
+        "from src.utils.linear_fit import fit_linear_regression\n"
+        "from src.utils.retrain_model import prepare_training_frame, sparse_design_matrix\n"
+        "df10 = prepare_training_frame(pd.read_csv({csv!r}))\n"
+        "X, _ = sparse_design_matrix(df10)\n"
+        "np.save({out!r}, fit_linear_regression(X, df10.price).coef_)\n"
+    ),
+    'train, streamed': (
+        "import numpy as np\n"
+        "from src.utils.streaming_training import fit_streaming\n"
+        "np.save({out!r}, fit_streaming({csv!r}, {chunksize})[0].coef_)\n"
+    ),
+    'cache, whole file': (
+        "import pandas as pd, pyarrow.feather as feather\n"
+        "from src.utils.dataset_cache import clean_dataset\n"
+        "feather.write_feather(clean_dataset(pd.read_csv({csv!r})), {out!r} + '.feather',\n"
+        "                      compression='uncompressed')\n"
+    ),
+    'cache, streamed': (
+        "from src.utils.dataset_cache import build_cache\n"
+        "build_cache({csv!r}, cache_dir={out!r} + '_cache', chunksize={chunksize})\n"
+    ),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark peak memory of chunked ingestion")
+    parser.add_argument('--rows', type=int, default=2_000_000, help="synthetic listings to write")
+    parser.add_argument('--chunksize', type=int, default=100_000, help="rows per chunk for the streamed variants")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Written by a child process: ru_maxrss carries over a fork, so a
+        # large parent would inflate every variant's reported peak
+        csv_path = str(Path(tmp) / 'listings.csv')
+        subprocess.run(
+            [sys.executable, '-W', 'ignore', '-c',
+             f"from benchmarks.synthetic import write_listings_csv; write_listings_csv({csv_path!r}, {args.rows})"],
+            check=True,
+        )
+        print(f"{args.rows} rows, {Path(csv_path).stat().st_size / 1024**2:.0f} MB CSV")
+
+        for i, (name, code) in enumerate(VARIANTS.items()):
+            out = str(Path(tmp) / f"variant{i}")
+            start = time.perf_counter()
+            result = subprocess.run(
+                [sys.executable, '-W', 'ignore', '-c',
+                 code.format(csv=csv_path, out=out, chunksize=args.chunksize) + PEAK_RSS],
+                check=True, capture_output=True, text=True,
+            )
+            elapsed = time.perf_counter() - start
+            print(f"{name:18s} peak RSS {int(result.stdout.split()[-1]):6d} MB  {elapsed:6.1f}s")
+
+        whole = np.load(Path(tmp) / 'variant0.npy')
+        streamed = np.load(Path(tmp) / 'variant1.npy')
+        if whole.shape == streamed.shape:
+            print(f"max |coef diff| streamed vs whole file: {np.abs(whole - streamed).max():.2e}")
+        else:
+            print(f"feature count differs: {whole.shape[0]} vs {streamed.shape[0]}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""Load test for the HTTP prediction service.
+
+Start the service, then run (from the repository root):
+
+    python -m src.utils.api_server --workers 4
+    python -m benchmarks.load_test --concurrency 16 --requests 500
+
+Each client thread keeps one HTTP/1.1 connection open and sends requests
+back to back. The script reports p50/p99 latency and overall requests/sec.
+"""
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+
+import numpy as np
+
+
+def make_payloads(locations, n, batch_size, seed=0):
+    """Random request bodies; single properties when batch_size is 1"""
+    rng = random.Random(seed)
+
+    def one():
+        return {
+            'location': rng.choice(locations),
+            'sqft': rng.randint(300, 5000),
+            'bhk': rng.randint(1, 5),
+            'bath': rng.randint(1, 5),
+            'balcony': rng.randint(0, 3),
+        }
+
+    if batch_size == 1:
+        return [json.dumps(one()) for _ in range(n)]
+    return [json.dumps({'properties': [one() for _ in range(batch_size)]}) for _ in range(n)]
+
+
+def run_client(host, port, path, payloads, latencies, errors):
+    conn = http.client.HTTPConnection(host, port)
+    headers = {'Content-Type': 'application/json'}
+    for body in payloads:
+        start = time.perf_counter()
+        conn.request('POST', path, body, headers)
+        response = conn.getresponse()
+        response.read()
+        latencies.append(time.perf_counter() - start)
+        if response.status != 200:
+            errors.append(response.status)
+    conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the prediction service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--concurrency', type=int, default=8, help="concurrent client connections")
+    parser.add_argument('--requests', type=int, default=500, help="requests per client")
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help="properties per request; above 1 uses /predict/batch")
+    args = parser.parse_args(argv)
+
+    conn = http.client.HTTPConnection(args.host, args.port)
+    conn.request('GET', '/locations')
+    locations = json.loads(conn.getresponse().read())['locations']
+    conn.close()
+
+    path = '/predict' if args.batch_size == 1 else '/predict/batch'
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(target=run_client, args=(
+            args.host, args.port, path,
+            make_payloads(locations, args.requests, args.batch_size, seed=i),
+            latencies, errors,
+        ))
+        for i in range(args.concurrency)
+    ]
+
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    latencies_ms = np.array(latencies) * 1000
+    print(f"{len(latencies)} requests to {path} ({args.batch_size} properties each), "
+          f"{args.concurrency} connections, {len(errors)} errors")
+    print(f"p50 latency:  {np.percentile(latencies_ms, 50):8.2f} ms")
+    print(f"p99 latency:  {np.percentile(latencies_ms, 99):8.2f} ms")
+    print(f"throughput:   {len(latencies) / elapsed:8.0f} requests/s")
+
+
+if __name__ == '__main__':
+    main()
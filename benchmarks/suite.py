@@ -0,0 +1,244 @@
+"""Benchmark suite for the prediction, cleaning and training hot paths.
+
+Usage (from the repository root):
+
+    python -m benchmarks.suite --scales 1 10 100
+    python -m benchmarks.suite --compare benchmarks/results/old.json benchmarks/results/new.json
+
+Each scale resamples Bengaluru_House_Data.csv to that many times its size
+(benchmarks.synthetic) and times cleaning, dataset loading, the outlier
+filters, model fitting and batch prediction on it. Single-prediction latency
+does not depend on the data size and is measured once. Results are written as
+JSON to --output (by default benchmarks/results/<UTC timestamp>.json) with
+the git commit and library versions, so two runs can be diffed with
+--compare. 1000x is about 13M rows and needs tens of GB of memory.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import sklearn
+from sklearn.linear_model import LinearRegression
+
+from benchmarks.synthetic import scaled_listings
+from src.utils.comparables import ComparablesIndex
+from src.utils.dataset_cache import build_cache, cache_path, load_cleaned_dataset
+from src.utils.linear_fit import fit_linear_regression
+from src.utils.model_registry import resolve_artifacts_dir
+from src.utils.prediction import INPUT_COLUMNS, load_artifacts
+from src.utils.prediction_cache import PredictionCache
+from src.utils.price_explorer import price_grid, rank_locations
+from src.utils.preprocessing import clean_listings, convert_sqft_to_num, remove_bhk_outliers, remove_pps_outliers
+from src.utils.retrain_model import clean_training_listings, prepare_training_frame, sparse_design_matrix
+from src.utils.scoring import make_scorer
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+# Dense get_dummies fits are skipped above this many matrix cells
+DENSE_FIT_MAX_CELLS = 50_000_000
+
+
+def measure(func, repeat, number=1, setup=None):
+    """Per-call wall times of func over repeat rounds of number calls each"""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def record(results, name, scale, rows, times):
+    """Append one result and print it"""
+    best = min(times)
+    results.append({
+        'benchmark': name,
+        'scale': scale,
+        'rows': rows,
+        'repeat': len(times),
+        'min_s': best,
+        'median_s': statistics.median(times),
+        'rows_per_s': rows / best if rows else None,
+    })
+    throughput = f"{rows / best:14,.0f} rows/s" if rows else ''
+    print(f"  {name:32s} {best * 1e3:12.3f} ms {throughput}", flush=True)
+
+
+def bench_single_prediction(results, repeat):
+    """Latency of one prediction through the scorer, the cache and sklearn"""
+    model, data_columns, locations, location_index = load_artifacts(resolve_artifacts_dir())
+    scorer = make_scorer(model, data_columns, location_index)
+    cache = PredictionCache()
+    x = np.zeros((1, len(data_columns)))
+    x[0, :4] = (1200, 2, 1, 2)
+    x[0, location_index['whitefield']] = 1
+
+    print("single prediction", flush=True)
+    record(results, 'predict.single.scorer', None, 1,
+           measure(lambda: scorer.predict_one('Whitefield', 1200, 2, 2, 1), repeat, number=10_000))
+    record(results, 'predict.single.cache_hit', None, 1,
+           measure(lambda: cache.get_price(scorer, 'Whitefield', 1200, 2, 2, 1), repeat, number=10_000))
+
+    def sklearn_predict():
+        # x has no feature names, which sklearn warns about on every call
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            return model.predict(x)
+
+    record(results, 'predict.single.sklearn', None, 1, measure(sklearn_predict, repeat, number=1_000))
+    grid_size = price_grid(scorer, 'Whitefield', 1).size
+    record(results, 'predict.what_if_grid', None, grid_size,
+           measure(lambda: price_grid(scorer, 'Whitefield', 1), repeat, number=1_000))
+
+    def rank_and_take():
+        ranking = rank_locations(scorer, 1500, 3, 3, 1, max_price=150)
+        ranking.cheapest(10)
+        ranking.priciest(10)
+
+    record(results, 'predict.rank_locations', None, len(locations), measure(rank_and_take, repeat, number=1_000))
+    return scorer
+
+
+def bench_scale(results, scale, scorer, repeat, tmp_dir):
+    """Cleaning, loading, filtering, fitting and batch prediction on scale x the dataset"""
+    raw = scaled_listings(scale)
+    rows = len(raw)
+    print(f"{scale}x ({rows:,} rows)", flush=True)
+
+    record(results, 'clean.convert_sqft_to_num', scale, rows,
+           measure(lambda: convert_sqft_to_num(raw['total_sqft']), repeat))
+    record(results, 'clean.clean_listings', scale, rows, measure(lambda: clean_listings(raw), repeat))
+
+    csv_path = Path(tmp_dir) / f"listings_{scale}x.csv"
+    raw.to_csv(csv_path, index=False)
+    cache_dir = Path(tmp_dir) / "cache"
+    record(results, 'load_data.cold', scale, rows,
+           measure(lambda: load_cleaned_dataset(csv_path, cache_dir=cache_dir), repeat,
+                   setup=lambda: cache_path(csv_path, cache_dir=cache_dir).unlink(missing_ok=True)))
+    build_cache(csv_path, cache_dir=cache_dir)
+    record(results, 'load_data.warm', scale, rows,
+           measure(lambda: load_cleaned_dataset(csv_path, cache_dir=cache_dir), repeat))
+    cleaned = load_cleaned_dataset(csv_path, cache_dir=cache_dir)
+    csv_path.unlink()
+
+    record(results, 'comparables.build', scale, len(cleaned), measure(lambda: ComparablesIndex(cleaned), repeat))
+    comparables = ComparablesIndex(cleaned)
+    record(results, 'comparables.query', scale, 1,
+           measure(lambda: comparables.query('Whitefield', 1200, 2, 2, 5800), repeat, number=1_000))
+
+    df6 = clean_training_listings(raw)
+    df7 = remove_pps_outliers(df6)
+    record(results, 'train.clean_training_listings', scale, rows,
+           measure(lambda: clean_training_listings(raw), repeat))
+    record(results, 'train.remove_pps_outliers', scale, len(df6), measure(lambda: remove_pps_outliers(df6), repeat))
+    record(results, 'train.remove_bhk_outliers', scale, len(df7), measure(lambda: remove_bhk_outliers(df7), repeat))
+
+    df10 = prepare_training_frame(raw)
+
+    def fit_sparse():
+        X, _ = sparse_design_matrix(df10)
+        fit_linear_regression(X, df10.price)
+
+    def fit_dense():
+        dummies = pd.get_dummies(df10.location).drop('other', axis='columns')
+        X = pd.concat([df10.drop(['location', 'price'], axis='columns'), dummies], axis='columns')
+        LinearRegression().fit(X, df10.price)
+
+    record(results, 'train.fit_sparse', scale, len(df10), measure(fit_sparse, repeat))
+    if len(df10) * df10.location.nunique() <= DENSE_FIT_MAX_CELLS:
+        record(results, 'train.fit_dense', scale, len(df10), measure(fit_dense, repeat))
+    else:
+        print(f"  {'train.fit_dense':32s} skipped (dense matrix too large)")
+
+    batch = df10.rename(columns={'total_sqft': 'sqft'})[INPUT_COLUMNS]
+    record(results, 'predict.batch', scale, len(batch),
+           measure(lambda: scorer.predict_frame(batch, on_unknown='ignore'), repeat))
+
+
+def environment():
+    """Where and on what the results were measured"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                check=True, cwd=Path(__file__).resolve().parent).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'sklearn': sklearn.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+def compare(base_path, new_path, threshold):
+    """Print min time ratios of matching benchmarks; True if none slowed beyond threshold"""
+    with open(base_path) as f:
+        base = json.load(f)
+    with open(new_path) as f:
+        new = json.load(f)
+    base_results = {(r['benchmark'], r['scale']): r for r in base['results']}
+
+    ok = True
+    print(f"{'benchmark':32s} {'scale':>6s} {'base ms':>12s} {'new ms':>12s} {'ratio':>7s}")
+    for r in new['results']:
+        b = base_results.get((r['benchmark'], r['scale']))
+        if b is None:
+            continue
+        ratio = r['min_s'] / b['min_s']
+        flag = ''
+        if ratio > threshold:
+            flag, ok = '  slower', False
+        scale = '-' if r['scale'] is None else f"{r['scale']}x"
+        print(f"{r['benchmark']:32s} {scale:>6s} {b['min_s'] * 1e3:12.3f} {r['min_s'] * 1e3:12.3f} "
+              f"{ratio:7.2f}{flag}")
+    return ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark prediction, cleaning and training")
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help="dataset size multiples to benchmark (10, 100, 1000, ...)")
+    parser.add_argument('--repeat', type=int, default=3, help="timed rounds per benchmark")
+    parser.add_argument('--output', type=Path, default=None, help="results JSON file")
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'NEW'), help="compare two results files and exit")
+    parser.add_argument('--threshold', type=float, default=1.2,
+                        help="with --compare, exit non-zero if any benchmark is this many times slower")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        sys.exit(0 if compare(*args.compare, args.threshold) else 1)
+
+    results = []
+    scorer = bench_single_prediction(results, args.repeat)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for scale in args.scales:
+            bench_scale(results, scale, scorer, args.repeat, tmp_dir)
+
+    meta = environment()
+    output = args.output or RESULTS_DIR / f"{meta['created'].replace(':', '').replace('+0000', 'Z')}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump({'metadata': meta, 'results': results}, f, indent=2)
+    print(f"Results written to {output}")
+
+
+if __name__ == '__main__':
+    main()
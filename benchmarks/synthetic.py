@@ -0,0 +1,36 @@
+"""Synthetic listings scaled up from Bengaluru_House_Data.csv.
+
+Rows are resampled with replacement, so columns keep the real data's mix of
+sizes, sqft ranges and odd units. Prices are jittered by up to ±10% so no
+two rows are identical. 2% of rows get a one-off location, keeping the long
+tail that is merged into 'other'. Without it every sampled location would
+have enough listings, 'other' would be empty and the least-squares solution
+would not be unique.
+"""
+import numpy as np
+import pandas as pd
+
+from src.utils.dataset_cache import DATA_PATH
+
+
+def make_synthetic_listings(n_rows, seed=0):
+    """n_rows raw listings resampled from Bengaluru_House_Data.csv"""
+    df = pd.read_csv(DATA_PATH)
+    df = df.sample(n=n_rows, replace=True, random_state=seed).reset_index(drop=True)
+    rng = np.random.default_rng(seed)
+    df['price'] = (df['price'] * rng.uniform(0.9, 1.1, n_rows)).round(3)
+    one_off = rng.random(n_rows) < 0.02
+    df.loc[one_off, 'location'] = [f"listing {i}" for i in np.flatnonzero(one_off)]
+    return df
+
+
+def scaled_listings(scale, seed=0):
+    """Raw listings scale times the size of Bengaluru_House_Data.csv"""
+    with open(DATA_PATH, 'rb') as f:
+        n_source = sum(1 for _ in f) - 1
+    return make_synthetic_listings(scale * n_source, seed)
+
+
+def write_listings_csv(path, n_rows, seed=0):
+    """Write n_rows synthetic listings to path as CSV"""
+    make_synthetic_listings(n_rows, seed).to_csv(path, index=False)
@@ -0,0 +1,201 @@
+"""Headless JSON HTTP prediction service.
+
+Usage (from the repository root):
+
+    python -m src.utils.api_server --port 8000 --workers 4
+
+Endpoints:
+
+    GET  /health          {"status": "ok"}
+    GET  /locations       {"locations": [...]}
+    GET  /stats           prediction cache hit/miss counters of the worker that answers
+    POST /predict         {"location": ..., "sqft": ..., "bhk": ..., "bath": ..., "balcony": ...}
+                          -> {"price": 123.45}
+    POST /predict/batch   {"properties": [{...}, ...]} -> {"prices": [...]}
+
+Prices are in Lakhs, rounded to 2 decimals like the Streamlit app. The current
+model version is loaded once before the workers are forked (from the compact
+JSON artifact when present, so sklearn is never imported), and every worker
+keeps the LinearScorer in memory. Each worker swaps in a newly published
+version in the background (model_registry.LiveModel), so retraining needs
+no restart. Workers share one listening socket and the kernel spreads
+connections across them.
+"""
+import argparse
+import json
+import math
+import os
+import signal
+import socket
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pandas as pd
+
+from src.utils.model_registry import LiveModel
+from src.utils.prediction import ARTIFACTS_DIR, INPUT_COLUMNS, UnknownLocationError
+from src.utils.prediction_cache import PredictionCache
+
+MAX_BODY_BYTES = 16 * 1024 * 1024
+
+
+class BadRequest(Exception):
+    """Client error reported as HTTP 400"""
+
+
+def _parse_property(payload):
+    if not isinstance(payload, dict):
+        raise BadRequest("Each property must be a JSON object")
+    missing = [col for col in INPUT_COLUMNS if col not in payload]
+    if missing:
+        raise BadRequest(f"Missing fields: {', '.join(missing)}")
+    try:
+        numbers = tuple(float(payload[col]) for col in ('sqft', 'bhk', 'bath', 'balcony'))
+    except (TypeError, ValueError):
+        raise BadRequest("sqft, bhk, bath and balcony must be numbers") from None
+    # float() accepts "nan" and "inf", which would price to a non-JSON NaN
+    if not all(math.isfinite(number) for number in numbers):
+        raise BadRequest("sqft, bhk, bath and balcony must be finite numbers")
+    return (str(payload['location']), *numbers)
+
+
+class PredictionHandler(BaseHTTPRequestHandler):
+    """Routes requests to the scorer held by the server"""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        # Headers and body go out as separate writes; without this, Nagle's
+        # algorithm and delayed ACKs add ~40 ms to every keep-alive request
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status, body):
+        data = json.dumps(body, allow_nan=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _read_json(self):
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+        except ValueError:
+            raise BadRequest("Content-Length must be an integer") from None
+        if length < 0:
+            raise BadRequest("Content-Length must not be negative")
+        if length > MAX_BODY_BYTES:
+            raise BadRequest("Request body too large")
+        try:
+            return json.loads(self.rfile.read(length) or b'null')
+        except ValueError:
+            raise BadRequest("Request body is not valid JSON") from None
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send_json(200, {'status': 'ok'})
+        elif self.path == '/locations':
+            self._send_json(200, {'locations': self.server.model.current()[1]})
+        elif self.path == '/stats':
+            self._send_json(200, {'pid': os.getpid(), 'cache': self.server.cache.stats()})
+        else:
+            self._send_json(404, {'error': f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        try:
+            if self.path == '/predict':
+                self._send_json(200, {'price': self.predict_one(self._read_json())})
+            elif self.path == '/predict/batch':
+                self._send_json(200, {'prices': self.predict_batch(self._read_json())})
+            else:
+                self._send_json(404, {'error': f"Unknown path {self.path}"})
+        except (BadRequest, UnknownLocationError) as e:
+            self._send_json(400, {'error': str(e)})
+
+    def predict_one(self, payload):
+        location, sqft, bhk, bath, balcony = _parse_property(payload)
+        scorer, _ = self.server.model.current()
+        price = self.server.cache.get_price(scorer, location, sqft, bhk, bath, balcony)
+        if not math.isfinite(price):
+            raise BadRequest("Property is outside the range the model can price")
+        return price
+
+    def predict_batch(self, payload):
+        properties = payload.get('properties') if isinstance(payload, dict) else None
+        if not isinstance(properties, list):
+            raise BadRequest("Expected {\"properties\": [...]}")
+        if not properties:
+            return []
+        df = pd.DataFrame([_parse_property(p) for p in properties], columns=INPUT_COLUMNS)
+        scorer, _ = self.server.model.current()
+        prices = np.round(scorer.predict_frame(df), 2)
+        if not np.isfinite(prices).all():
+            raise BadRequest("A property is outside the range the model can price")
+        return prices.tolist()
+
+
+class PredictionServer(ThreadingHTTPServer):
+    """Threaded HTTP server holding the live model"""
+
+    daemon_threads = True
+
+    def __init__(self, address, model, cache_size=4096, verbose=False):
+        super().__init__(address, PredictionHandler)
+        self.model = model
+        self.cache = PredictionCache(cache_size)
+        self.verbose = verbose
+
+
+def serve(host='127.0.0.1', port=8000, workers=1, artifacts_dir=ARTIFACTS_DIR,
+          cache_size=4096, verbose=False):
+    """Run the service with the given number of worker processes"""
+    server = PredictionServer((host, port), LiveModel(artifacts_dir), cache_size, verbose)
+
+    children = []
+    if workers > 1 and hasattr(os, 'fork'):
+        for _ in range(workers - 1):
+            pid = os.fork()
+            if pid == 0:
+                signal.signal(signal.SIGTERM, lambda *_: os._exit(0))
+                try:
+                    server.serve_forever()
+                finally:
+                    os._exit(0)
+            children.append(pid)
+
+    # Let SIGTERM unwind like Ctrl-C so the workers are shut down too
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+    print(f"Serving predictions on http://{host}:{server.server_address[1]} "
+          f"with {len(children) + 1} worker(s)", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            os.kill(pid, signal.SIGTERM)
+        for pid in children:
+            os.waitpid(pid, 0)
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve house price predictions over HTTP")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind")
+    parser.add_argument('--port', type=int, default=8000, help="port to listen on")
+    parser.add_argument('--workers', type=int, default=1, help="worker processes (POSIX only)")
+    parser.add_argument('--artifacts', default=ARTIFACTS_DIR, help="directory holding the model artifacts")
+    parser.add_argument('--cache-size', type=int, default=4096, help="single predictions kept in the LRU cache")
+    parser.add_argument('--verbose', action='store_true', help="log every request")
+    args = parser.parse_args(argv)
+
+    serve(args.host, args.port, args.workers, args.artifacts, args.cache_size, args.verbose)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""Opt-in timing of the Streamlit app's work on each rerun.
+
+Profiling is off unless the APP_PROFILE environment variable is set to 1 or
+the page is opened with ?profile=1. When on, app.py wraps artifact loading,
+dataset loading, predictions and every Plotly figure in
+RerunProfile.stage(). At the end of the rerun the stages are shown in a
+debug panel and appended as one JSON line to logs/app_profile.jsonl
+(APP_PROFILE_LOG overrides the path).
+
+Streamlit runs a cached function's body only on a miss, so each cached
+function calls note_cache_miss() with its name. A cached stage that saw no
+such call was served from the cache. Streamlit runs each session's script
+in its own thread, so the profile collecting those calls is thread-local.
+"""
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROFILE_ENV = 'APP_PROFILE'
+LOG_ENV = 'APP_PROFILE_LOG'
+LOG_PATH = Path(__file__).resolve().parents[2] / "logs" / "app_profile.jsonl"
+
+_active = threading.local()
+_log_lock = threading.Lock()
+
+
+def profiling_enabled(query_params=None):
+    """True if APP_PROFILE=1 or the query string has profile=1"""
+    if os.environ.get(PROFILE_ENV, '') == '1':
+        return True
+    return query_params is not None and query_params.get('profile') == '1'
+
+
+def note_cache_miss(name):
+    """Record that a cached function's body ran; a no-op when not profiling"""
+    profile = getattr(_active, 'profile', None)
+    if profile is not None:
+        profile.misses.add(name)
+
+
+class RerunProfile:
+    """Stage timings and cache outcomes for one script run"""
+
+    def __init__(self, page, enabled):
+        self.page = page
+        self.enabled = enabled
+        self.stages = []
+        self.misses = set()
+        self.started = datetime.now(timezone.utc)
+        self._start_time = time.perf_counter()
+        if enabled:
+            _active.profile = self
+
+    @contextmanager
+    def stage(self, name, cached=False):
+        """Time the enclosed block; with cached=True also record hit or miss"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            record = {'stage': name, 'ms': (time.perf_counter() - start) * 1e3}
+            if cached:
+                record['cache'] = 'miss' if name in self.misses else 'hit'
+            self.stages.append(record)
+
+    def finish(self):
+        """Stop collecting and return the rerun's record"""
+        _active.profile = None
+        return {
+            'started': self.started.isoformat(timespec='milliseconds'),
+            'page': self.page,
+            'total_ms': (time.perf_counter() - self._start_time) * 1e3,
+            'stages': self.stages,
+        }
+
+    @staticmethod
+    def write(record, path=None):
+        """Append the record as one JSON line"""
+        path = path or os.environ.get(LOG_ENV) or LOG_PATH
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        line = json.dumps(record) + '\n'
+        with _log_lock:
+            with open(path, 'a') as f:
+                f.write(line)
@@ -0,0 +1,73 @@
+"""Score a CSV of properties in bulk.
+
+Usage (from the repository root):
+
+    python -m src.utils.batch_predict listings.csv prices.csv
+
+The input needs the columns location, sqft, bhk, bath and balcony. It is
+read in chunks and every chunk is priced with one vectorized pass of the
+current model version's scorer (the closed-form LinearScorer for linear
+models), so large feeds are streamed to the output file without loading
+them whole. The output is written next to its destination and renamed
+into place only once every chunk has been scored, so a failed run never
+leaves a truncated file behind. Use "-" for stdin/stdout. Unknown
+locations abort the run unless --on-unknown ignore is given, in which
+case they are priced as 'other'.
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+from src.utils.model_registry import load_current_scorer
+from src.utils.prediction import ARTIFACTS_DIR, UnknownLocationError
+
+
+def predict_csv(input_file, output_file, scorer, chunksize=50000, on_unknown='raise'):
+    """Stream input_file through the model, appending a price column to output_file"""
+    rows = 0
+    header = True
+    for chunk in pd.read_csv(input_file, chunksize=chunksize):
+        chunk['price'] = np.round(scorer.predict_frame(chunk, on_unknown), 2)
+        chunk.to_csv(output_file, index=False, header=header)
+        header = False
+        rows += len(chunk)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Predict house prices for a CSV of properties")
+    parser.add_argument('input', help="input CSV with location, sqft, bhk, bath, balcony ('-' for stdin)")
+    parser.add_argument('output', help="output CSV path ('-' for stdout)")
+    parser.add_argument('--chunksize', type=int, default=50000, help="rows scored per predict call")
+    parser.add_argument('--on-unknown', choices=['raise', 'ignore'], default='raise',
+                        help="fail on unknown locations or price them as 'other'")
+    parser.add_argument('--artifacts', default=ARTIFACTS_DIR, help="directory holding the model artifacts")
+    args = parser.parse_args(argv)
+
+    scorer, _ = load_current_scorer(args.artifacts)
+
+    input_file = sys.stdin if args.input == '-' else args.input
+    try:
+        if args.output == '-':
+            rows = predict_csv(input_file, sys.stdout, scorer, args.chunksize, args.on_unknown)
+        else:
+            tmp_path = f"{args.output}.tmp-{os.getpid()}"
+            try:
+                with open(tmp_path, 'w', newline='') as f:
+                    rows = predict_csv(input_file, f, scorer, args.chunksize, args.on_unknown)
+                os.replace(tmp_path, args.output)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+    except UnknownLocationError as e:
+        parser.exit(1, f"error: {e}\n")
+
+    print(f"Scored {rows} properties", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
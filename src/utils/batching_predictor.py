@@ -0,0 +1,200 @@
+"""Coalesce concurrent single-property predictions into batched predict calls.
+
+Callers on any thread call predict_one() and block. A worker thread takes
+every waiting request (up to max_batch), optionally waiting up to max_wait
+seconds after the first for more to arrive, and prices them all with one
+scorer.predict call. Each caller then gets its own result, or its own
+error (an UnknownLocationError, or a ValueError for a non-numeric
+feature) without affecting the rest of the batch. With the default max_wait of 0 the batches form
+naturally: requests that arrive while one batch is being scored make up
+the next, so a lone caller pays only the hand-off to the worker.
+
+This pays off when a single predict call costs far more than a row, as with
+SklearnScorer (~0.2 ms of sklearn input validation whatever the batch
+size): benchmarks/bench_batching.py measures 1.4x the direct throughput
+with 2 callers and 7.7x with 64. The closed-form LinearScorer prices a row
+in about a microsecond, less than the hand-off, so it is called directly.
+"""
+import threading
+import time
+from collections import deque
+
+import numpy as np
+
+from src.utils.prediction import resolve_location
+
+MAX_BATCH = 256
+MAX_WAIT = 0.0
+# Recent queue waits kept for percentiles
+WAIT_SAMPLES = 10_000
+
+
+class _Request:
+    __slots__ = ('scorer', 'args', 'enqueued', 'done', 'result', 'error')
+
+    def __init__(self, scorer, args):
+        self.scorer = scorer
+        self.args = args
+        self.enqueued = time.perf_counter()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class BoundPredictor:
+    """A scorer whose predict_one goes through a BatchingPredictor.
+
+    Exposes checksum and location_index like the scorer, so it can stand in
+    for it, e.g. in PredictionCache.get_price.
+    """
+
+    def __init__(self, batcher, scorer):
+        self.batcher = batcher
+        self.scorer = scorer
+        self.location_index = scorer.location_index
+
+    @property
+    def checksum(self):
+        return self.scorer.checksum
+
+    def predict_one(self, location, sqft, bhk, bath, balcony):
+        """Predict the price (in Lakhs) of a single property in the next batch"""
+        return self.batcher.predict_one(location, sqft, bhk, bath, balcony, scorer=self.scorer)
+
+
+class BatchingPredictor:
+    """Thread-safe predictor that prices concurrent requests in batches.
+
+    model is a scorer or a LiveModel. With a LiveModel each request is
+    priced by the version that was live when it was submitted.
+    """
+
+    def __init__(self, model, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._pending = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._stats_lock = threading.Lock()
+        self._waits = deque(maxlen=WAIT_SAMPLES)
+        self.requests = 0
+        self.batches = 0
+        self.max_batch_seen = 0
+        self._worker = threading.Thread(target=self._run, name='batching-predictor', daemon=True)
+        self._worker.start()
+
+    def _current_scorer(self):
+        return self.model.current()[0] if hasattr(self.model, 'current') else self.model
+
+    def bind(self, scorer=None):
+        """BoundPredictor for scorer (by default the model's current one)"""
+        return BoundPredictor(self, scorer or self._current_scorer())
+
+    def predict_one(self, location, sqft, bhk, bath, balcony, scorer=None, timeout=None):
+        """Predict the price (in Lakhs) of a single property, batched with concurrent calls"""
+        request = _Request(scorer or self._current_scorer(), (location, sqft, bhk, bath, balcony))
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("BatchingPredictor is closed")
+            self._pending.append(request)
+            self._cond.notify()
+        if not request.done.wait(timeout):
+            raise TimeoutError("Prediction was not batched in time")
+        if request.error is not None:
+            raise request.error
+        return request.result
+
+    def _next_batch(self):
+        with self._cond:
+            while not self._pending and not self._closed:
+                self._cond.wait()
+            if not self._pending:
+                return None
+            deadline = self._pending[0].enqueued + self.max_wait
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            n = min(len(self._pending), self.max_batch)
+            return [self._pending.popleft() for _ in range(n)]
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            started = time.perf_counter()
+            with self._stats_lock:
+                self.requests += len(batch)
+                self.batches += 1
+                self.max_batch_seen = max(self.max_batch_seen, len(batch))
+                self._waits.extend(started - request.enqueued for request in batch)
+
+            try:
+                # Usually one scorer per batch; more only across a model swap
+                by_scorer = {}
+                for request in batch:
+                    by_scorer.setdefault(id(request.scorer), []).append(request)
+                for requests in by_scorer.values():
+                    self._score(requests)
+            except Exception as e:
+                # Never let one batch stop the worker; fail just these requests
+                for request in batch:
+                    if request.result is None and request.error is None:
+                        request.error = e
+            finally:
+                for request in batch:
+                    request.done.set()
+
+    @staticmethod
+    def _score(requests):
+        scorer = requests[0].scorer
+        valid = []
+        loc_index = []
+        numeric = []
+        for request in requests:
+            try:
+                index = resolve_location(request.args[0], scorer.location_index)
+                values = [float(value) for value in request.args[1:]]
+            except Exception as e:
+                request.error = e
+            else:
+                valid.append(request)
+                loc_index.append(index)
+                numeric.append(values)
+        if not valid:
+            return
+        numeric = np.array(numeric)
+        try:
+            prices = scorer.predict(np.array(loc_index), numeric[:, 0], numeric[:, 1], numeric[:, 2], numeric[:, 3])
+        except Exception as e:
+            for request in valid:
+                request.error = e
+            return
+        for request, price in zip(valid, prices.tolist()):
+            request.result = price
+
+    def close(self):
+        """Finish the queued requests and stop the worker"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._worker.join()
+
+    def stats(self):
+        """Batch-size and queue-wait counters for monitoring"""
+        with self._stats_lock:
+            waits = np.array(self._waits)
+            return {
+                'requests': self.requests,
+                'batches': self.batches,
+                'mean_batch_size': self.requests / self.batches if self.batches else 0.0,
+                'max_batch_size': self.max_batch_seen,
+                'queue_wait_ms_p50': float(np.percentile(waits, 50)) * 1e3 if len(waits) else 0.0,
+                'queue_wait_ms_p99': float(np.percentile(waits, 99)) * 1e3 if len(waits) else 0.0,
+                'queue_wait_ms_max': float(waits.max()) * 1e3 if len(waits) else 0.0,
+            }
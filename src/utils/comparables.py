@@ -0,0 +1,56 @@
+"""Nearest real listings to a property, as evidence for its estimate.
+
+ComparablesIndex is built once per dataset version from the cleaned
+listings. Each location gets its own KD-tree over total_sqft, bhk, bath and
+price_per_sqft, each scaled by its standard deviation over the whole
+dataset so one unit means the same in every location. A query is a tree
+lookup in the property's location, not a filter over the whole frame.
+"""
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from src.utils.prediction import normalize_location
+
+FEATURES = ['total_sqft', 'bhk', 'bath', 'price_per_sqft']
+COLUMNS = ['location', 'size', 'total_sqft', 'bath', 'balcony', 'price', 'price_per_sqft']
+DEFAULT_K = 5
+
+
+class ComparablesIndex:
+    """Per-location nearest-neighbour index over the cleaned listings"""
+
+    def __init__(self, df):
+        df = df.dropna(subset=FEATURES)
+        points = df[FEATURES].to_numpy(dtype=float)
+        scale = points.std(axis=0)
+        self.scale = np.where(scale > 0, scale, 1.0)
+
+        # Vectorized normalize_location
+        codes, names = pd.factorize(df['location'].str.strip().str.lower())
+        order = np.argsort(codes, kind='stable')
+        bounds = np.searchsorted(codes[order], np.arange(len(names) + 1))
+        # Listings sorted by location, so each tree's hits index one slice
+        self._columns = {col: df[col].to_numpy()[order] for col in COLUMNS}
+        self._trees = {}
+        for i, name in enumerate(names):
+            start, stop = bounds[i], bounds[i + 1]
+            self._trees[name] = (start, cKDTree(points[order[start:stop]] / self.scale))
+
+    def query(self, location, sqft, bhk, bath, price_per_sqft, k=DEFAULT_K):
+        """Up to k listings in location closest to the property, nearest first.
+
+        Each is a dict of COLUMNS plus its scaled distance. A location with
+        no listings gives an empty list.
+        """
+        entry = self._trees.get(normalize_location(location))
+        if entry is None:
+            return []
+        start, tree = entry
+        k = min(k, tree.n)
+        target = np.array([sqft, bhk, bath, price_per_sqft], dtype=float) / self.scale
+        distances, positions = tree.query(target, k=[*range(1, k + 1)])
+        rows = start + positions
+        columns = [self._columns[col][rows].tolist() for col in COLUMNS]
+        return [{**dict(zip(COLUMNS, values)), 'distance': distance}
+                for *values, distance in zip(*columns, distances.tolist())]
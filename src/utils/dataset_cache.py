@@ -0,0 +1,135 @@
+"""Columnar cache of the cleaned listings used by the Visualizations page.
+
+The cleaned frame is written, chunk by chunk, as an uncompressed Feather
+(Arrow IPC) file named after the SHA-256 of the source CSV. While the CSV is unchanged, loading
+memory-maps that file instead of re-parsing and re-cleaning the CSV. When the
+CSV changes its hash no longer matches, and the cache is rebuilt on next load.
+
+Build it ahead of time (from the repository root) with:
+
+    python -m src.utils.dataset_cache
+"""
+import argparse
+import hashlib
+import os
+import threading
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from src.utils.preprocessing import CSV_DTYPES, clean_listings
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+DATA_PATH = ROOT_DIR / "data" / "Bengaluru_House_Data.csv"
+CACHE_DIR = ROOT_DIR / "data" / "cache"
+CHUNKSIZE = 100_000
+
+
+# path -> ((st_mtime_ns, st_size), digest) of the last hash of each CSV
+_digests = {}
+_digests_lock = threading.Lock()
+
+
+def csv_digest(csv_path=DATA_PATH):
+    """SHA-256 hex digest of the CSV contents.
+
+    The digest is remembered per path along with the file's mtime and size,
+    and the file is only re-hashed once either changes, so the app can call
+    this on every rerun without reading the whole CSV each time.
+    """
+    path = os.path.abspath(csv_path)
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _digests_lock:
+        cached = _digests.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    with _digests_lock:
+        _digests[path] = (key, digest.hexdigest())
+    return digest.hexdigest()
+
+
+def cache_path(csv_path=DATA_PATH, digest=None, cache_dir=CACHE_DIR):
+    """Location of the cleaned cache for this version of the CSV"""
+    digest = digest or csv_digest(csv_path)
+    return Path(cache_dir) / f"{Path(csv_path).stem}-{digest[:16]}.feather"
+
+
+def clean_dataset(df):
+    """Clean raw listings the way the Visualizations page shows them"""
+    df = clean_listings(df.dropna())
+    return df[df['total_sqft'].notna()].reset_index(drop=True)
+
+
+def read_cleaned_chunks(csv_path=DATA_PATH, chunksize=CHUNKSIZE):
+    """Cleaned frames of up to chunksize CSV rows each"""
+    for chunk in pd.read_csv(csv_path, chunksize=chunksize, dtype=CSV_DTYPES):
+        yield clean_dataset(chunk)
+
+
+def build_cache(csv_path=DATA_PATH, digest=None, cache_dir=CACHE_DIR, chunksize=CHUNKSIZE):
+    """Clean the CSV and write its columnar cache, removing stale versions.
+
+    The CSV is cleaned and written one chunk at a time, so building the
+    cache never holds the whole file in memory. Returns the cleaned frame,
+    memory-mapped from the new cache.
+    """
+    path = cache_path(csv_path, digest, cache_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+
+    writer = schema = None
+    try:
+        for df in read_cleaned_chunks(csv_path, chunksize):
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                writer = pa.ipc.new_file(tmp_path, schema)
+            writer.write_table(table.cast(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp_path, path)
+
+    for stale in path.parent.glob(f"{Path(csv_path).stem}-*.feather"):
+        if stale != path:
+            stale.unlink(missing_ok=True)
+    return feather.read_table(path, memory_map=True).to_pandas()
+
+
+def load_cleaned_dataset(csv_path=DATA_PATH, digest=None, cache_dir=CACHE_DIR):
+    """Cleaned listings, memory-mapped from the cache when it is fresh.
+
+    Falls back to parsing the CSV when the cache is missing or stale, and
+    refreshes it if the cache directory is writable.
+    """
+    path = cache_path(csv_path, digest, cache_dir)
+    if path.exists():
+        return feather.read_table(path, memory_map=True).to_pandas()
+
+    try:
+        return build_cache(csv_path, digest, cache_dir)
+    except OSError:
+        # Read-only deployments still work, just without the cache
+        return pd.concat(read_cleaned_chunks(csv_path), ignore_index=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the cleaned dataset cache")
+    parser.add_argument('--csv', default=DATA_PATH, help="source CSV")
+    parser.add_argument('--cache-dir', default=CACHE_DIR, help="directory for the cache file")
+    args = parser.parse_args(argv)
+
+    df = build_cache(args.csv, cache_dir=args.cache_dir)
+    print(f"Cached {len(df)} rows to {cache_path(args.csv, cache_dir=args.cache_dir)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Incremental retraining from listings appended to the CSV.
+
+A full retrain re-reads and re-cleans every row. TrainingState instead
+remembers how far into the CSV it has read and keeps:
+
+- the listing count of every location, which decides whether it is merged
+  into 'other';
+- the cleaned rows that pass the per-row filters, in file order, so a
+  location's outlier filters can be re-run when its statistics move;
+- per location, the normal-equation sums (NormalEquations over the four
+  numeric columns) of the rows that survive the outlier filters.
+
+An update parses only the bytes appended since the last run. It re-filters
+only the locations those rows touch: their own locations, plus 'other' and
+the promoted location when a location crosses RARE_LOCATION_MAX. The
+location dummies are 0/1 and each row has one, so the full X'X and X'y are
+assembled from the per-location sums without revisiting any rows. The
+result is the least-squares fit a full retrain would find on the same
+retained rows, without the holdout split.
+
+If the consumed part of the file has changed (edited rather than appended,
+or a new row continues the last line), the state is rebuilt from scratch.
+"""
+import hashlib
+import io
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+
+from src.utils.dataset_cache import CACHE_DIR
+from src.utils.linear_fit import NormalEquations, to_linear_regression
+from src.utils.prediction import NUMERIC_COLUMNS, OTHER_LOCATION
+from src.utils.preprocessing import RARE_LOCATION_MAX, clean_listings, remove_outliers
+
+STATE_PATH = CACHE_DIR / "training_state.pickle"
+STATE_VERSION = 1
+TEXT_COLUMNS = {'location': str, 'size': str, 'total_sqft': str}
+ROW_COLUMNS = ['location', 'total_sqft', 'bath', 'balcony', 'bhk', 'price', 'price_per_sqft']
+
+
+def combine_location_equations(location_equations):
+    """Assemble NormalEquations over numeric columns plus one dummy per location.
+
+    location_equations maps each location to the NormalEquations of its rows
+    over NUMERIC_COLUMNS. 'other' is the baseline and gets no dummy, like the
+    dropped get_dummies column. Returns (equations, feature_names).
+    """
+    names = sorted(name for name, eq in location_equations.items()
+                   if name != OTHER_LOCATION and eq.n_samples > 0)
+    n_numeric = len(NUMERIC_COLUMNS)
+    column = {name: n_numeric + i for i, name in enumerate(names)}
+    num = slice(0, n_numeric)
+
+    total = NormalEquations(n_numeric + len(names))
+    for name, eq in location_equations.items():
+        total.n_samples += eq.n_samples
+        total.sum_y += eq.sum_y
+        total.sum_x[num] += eq.sum_x
+        total.xtx[num, num] += eq.xtx
+        total.xty[num] += eq.xty
+        j = column.get(name)
+        if j is not None:
+            total.sum_x[j] = total.xtx[j, j] = eq.n_samples
+            total.xtx[num, j] = total.xtx[j, num] = eq.sum_x
+            total.xty[j] = eq.sum_y
+    return total, NUMERIC_COLUMNS + names
+
+
+def equations_by_location(df):
+    """NormalEquations over NUMERIC_COLUMNS for the rows of each location in df"""
+    codes, names = pd.factorize(df['location'])
+    order = np.argsort(codes, kind='stable')
+    features = df[NUMERIC_COLUMNS].to_numpy(dtype=float)[order]
+    price = df['price'].to_numpy(dtype=float)[order]
+    bounds = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(names)))]
+    equations = {}
+    for i, name in enumerate(names):
+        rows = slice(bounds[i], bounds[i + 1])
+        equations[name] = NormalEquations(len(NUMERIC_COLUMNS)).update(features[rows], price[rows])
+    return equations
+
+
+class TrainingState:
+    """What incremental retraining keeps between runs"""
+
+    def __init__(self):
+        self.version = STATE_VERSION
+        self.header = None
+        self.offset = 0
+        self.digest = hashlib.sha256().hexdigest()
+        self.ends_with_newline = True
+        self.location_counts = pd.Series(dtype='int64')
+        self.rows = pd.DataFrame({col: pd.Series(dtype=float) for col in ROW_COLUMNS})
+        self.rows['location'] = self.rows['location'].astype(object)
+        self.location_equations = {}
+
+    @property
+    def n_samples(self):
+        return sum(eq.n_samples for eq in self.location_equations.values())
+
+    @classmethod
+    def load(cls, path=STATE_PATH):
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        if getattr(state, 'version', None) != STATE_VERSION:
+            raise ValueError(f"{path} has an unsupported training state version")
+        return state
+
+    def save(self, path=STATE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(self, f)
+        os.replace(tmp_path, path)
+
+    def _read_new_bytes(self, csv_path):
+        """Bytes appended since the last update, or None if the consumed prefix changed"""
+        with open(csv_path, 'rb') as f:
+            digest = hashlib.sha256()
+            remaining = self.offset
+            while remaining:
+                block = f.read(min(remaining, 1 << 20))
+                if not block:
+                    return None
+                digest.update(block)
+                remaining -= len(block)
+            if digest.hexdigest() != self.digest:
+                return None
+            new_bytes = f.read()
+
+        if new_bytes and not self.ends_with_newline and not new_bytes.startswith((b'\n', b'\r')):
+            return None
+        digest.update(new_bytes)
+        self.digest = digest.hexdigest()
+        self.offset += len(new_bytes)
+        if new_bytes:
+            self.ends_with_newline = new_bytes.endswith(b'\n')
+        return new_bytes
+
+    def update(self, csv_path):
+        """Read rows appended to csv_path and refresh the affected locations.
+
+        Returns the number of rows read.
+        """
+        new_bytes = self._read_new_bytes(csv_path)
+        if new_bytes is None:
+            print("Consumed part of the CSV changed; rebuilding training state")
+            self.__init__()
+            new_bytes = self._read_new_bytes(csv_path)
+        if not new_bytes.strip():
+            return 0
+
+        if self.header is None:
+            raw = pd.read_csv(io.BytesIO(new_bytes), dtype=TEXT_COLUMNS)
+            self.header = list(raw.columns)
+        else:
+            raw = pd.read_csv(io.BytesIO(new_bytes), header=None, names=self.header, dtype=TEXT_COLUMNS)
+        self.add_listings(raw)
+        return len(raw)
+
+    def add_listings(self, raw):
+        """Clean raw CSV rows, add them to the state and re-filter touched locations"""
+        df = clean_listings(raw.drop(['area_type', 'availability', 'society'], axis='columns').dropna())
+
+        old_counts = self.location_counts
+        self.location_counts = old_counts.add(df['location'].value_counts(), fill_value=0).astype('int64')
+        seen = self.location_counts.index.intersection(df['location'].unique())
+        was_rare = old_counts.reindex(seen, fill_value=0) <= RARE_LOCATION_MAX
+        promoted = seen[(was_rare & (self.location_counts[seen] > RARE_LOCATION_MAX)).to_numpy()]
+
+        df = df[~((df.total_sqft / df.bhk) < 300)]
+        rows = df[ROW_COLUMNS].astype({col: float for col in ROW_COLUMNS if col != 'location'})
+        self.rows = pd.concat([self.rows, rows], ignore_index=True) if len(self.rows) else rows.reset_index(drop=True)
+
+        touched = set(self._reduced_locations(rows['location']))
+        if len(promoted):
+            touched |= {OTHER_LOCATION, *promoted}
+        self._refilter(touched)
+
+    def _reduced_locations(self, location):
+        rare = location.map(self.location_counts).to_numpy() <= RARE_LOCATION_MAX
+        return location.mask(rare, OTHER_LOCATION)
+
+    def _refilter(self, touched):
+        """Recompute the normal-equation sums of the touched locations from their rows"""
+        reduced = self._reduced_locations(self.rows['location'])
+        mask = reduced.isin(touched)
+        kept = remove_outliers(self.rows[mask].assign(location=reduced[mask]))
+
+        for name in touched:
+            self.location_equations.pop(name, None)
+        self.location_equations.update(equations_by_location(kept))
+
+    def fit(self):
+        """Return (model, feature_names) for the retained rows"""
+        equations, feature_names = combine_location_equations(self.location_equations)
+        return to_linear_regression(*equations.solve()), feature_names
@@ -0,0 +1,93 @@
+"""Least-squares fitting from normal-equation sufficient statistics.
+
+sklearn's LinearRegression falls back to an iterative lsqr solver on sparse
+input, which converges poorly here because total_sqft is orders of magnitude
+larger than the 0/1 location dummies. Instead we accumulate X'X, X'y and the
+column sums (cheap for CSR input: a few nonzeros per row), and solve the
+small centered and standardized system directly. This gives the same
+solution as a dense fit.
+"""
+import numpy as np
+import scipy.linalg
+from scipy import sparse
+from sklearn.base import BaseEstimator, RegressorMixin
+from sklearn.linear_model import LinearRegression
+
+
+class NormalEquations:
+    """Running sums needed to solve ordinary least squares with an intercept"""
+
+    def __init__(self, n_features):
+        self.n_samples = 0
+        self.sum_x = np.zeros(n_features)
+        self.sum_y = 0.0
+        self.xtx = np.zeros((n_features, n_features))
+        self.xty = np.zeros(n_features)
+
+    def update(self, X, y):
+        """Add a block of rows (dense or sparse X) to the statistics"""
+        y = np.asarray(y, dtype=float)
+        self.n_samples += X.shape[0]
+        self.sum_x += np.asarray(X.sum(axis=0)).ravel()
+        self.sum_y += y.sum()
+        xtx = X.T @ X
+        self.xtx += xtx.toarray() if sparse.issparse(xtx) else xtx
+        self.xty += np.asarray(X.T @ y).ravel()
+        return self
+
+    def merge(self, other):
+        """Add the statistics of another NormalEquations over the same columns"""
+        self.n_samples += other.n_samples
+        self.sum_x += other.sum_x
+        self.sum_y += other.sum_y
+        self.xtx += other.xtx
+        self.xty += other.xty
+        return self
+
+    def solve(self):
+        """Return (intercept, coef) of the least-squares fit"""
+        if self.n_samples == 0:
+            raise ValueError("No samples to fit")
+        n = self.n_samples
+        mean_x = self.sum_x / n
+        mean_y = self.sum_y / n
+
+        cov = self.xtx - n * np.outer(mean_x, mean_x)
+        cov_xy = self.xty - n * mean_x * mean_y
+
+        # Standardize so sqft and the dummies are on a comparable scale;
+        # constant columns keep scale 1 and end up with a zero coefficient
+        scale = np.sqrt(np.clip(np.diag(cov), 0, None))
+        scale[scale == 0] = 1.0
+        coef_scaled = scipy.linalg.lstsq(cov / np.outer(scale, scale), cov_xy / scale)[0]
+
+        coef = coef_scaled / scale
+        intercept = mean_y - mean_x @ coef
+        return intercept, coef
+
+
+class NormalEquationRegression(RegressorMixin, BaseEstimator):
+    """Ordinary least squares fit through NormalEquations; accepts CSR input"""
+
+    def fit(self, X, y):
+        self.intercept_, self.coef_ = NormalEquations(X.shape[1]).update(X, y).solve()
+        self.n_features_in_ = X.shape[1]
+        return self
+
+    def predict(self, X):
+        return np.asarray(X @ self.coef_).ravel() + self.intercept_
+
+
+def to_linear_regression(intercept, coef):
+    """Wrap solved coefficients in a fitted LinearRegression for the artifact"""
+    model = LinearRegression()
+    model.coef_ = np.asarray(coef, dtype=float)
+    model.intercept_ = float(intercept)
+    model.n_features_in_ = len(model.coef_)
+    return model
+
+
+def fit_linear_regression(X, y):
+    """Fit ordinary least squares on dense or sparse X via the normal equations"""
+    stats = NormalEquations(X.shape[1]).update(X, y)
+    return to_linear_regression(*stats.solve())
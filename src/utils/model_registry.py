@@ -0,0 +1,211 @@
+"""Versioned model artifacts with an atomic "current" pointer.
+
+retrain_model.py publishes each model into its own directory,
+
+    src/models/artifacts/versions/<UTC timestamp>-<hash>/
+        bangalore_home_prices_model.pickle
+        bangalore_home_prices_model.json
+        columns.json
+
+and then points src/models/artifacts/CURRENT at it. The files are written to
+a staging directory that is renamed into place once complete, and CURRENT is
+replaced with os.replace, so a reader sees either the old version or the
+new one and never a half-written file. Without a CURRENT file (a fresh
+clone) the artifacts directly in src/models/artifacts are used.
+
+LiveModel keeps a scorer in memory and swaps in newly published versions
+from a background thread, so long-running servers pick up a retrained model
+without a restart. List versions or roll back with:
+
+    python -m src.utils.model_registry
+    python -m src.utils.model_registry --activate 20240101T000000Z-0123abcd
+"""
+import argparse
+import hashlib
+import os
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from src.utils.prediction import ARTIFACTS_DIR
+from src.utils.scoring import load_scorer
+
+VERSIONS_DIR = 'versions'
+CURRENT_FILE = 'CURRENT'
+KEEP_VERSIONS = 5
+CHECK_INTERVAL = 5.0
+
+
+def current_version(artifacts_dir=ARTIFACTS_DIR):
+    """Version CURRENT points at, or None if nothing has been published"""
+    try:
+        with open(Path(artifacts_dir) / CURRENT_FILE) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def resolve_artifacts_dir(artifacts_dir=ARTIFACTS_DIR):
+    """Directory holding the current version's files"""
+    version = current_version(artifacts_dir)
+    if version is None:
+        return Path(artifacts_dir)
+    return Path(artifacts_dir) / VERSIONS_DIR / version
+
+
+def list_versions(artifacts_dir=ARTIFACTS_DIR):
+    """Published versions, oldest first"""
+    versions_dir = Path(artifacts_dir) / VERSIONS_DIR
+    if not versions_dir.is_dir():
+        return []
+    return sorted(p.name for p in versions_dir.iterdir() if p.is_dir() and not p.name.startswith('.'))
+
+
+def set_current(artifacts_dir, version):
+    """Atomically point CURRENT at a published version"""
+    if not (Path(artifacts_dir) / VERSIONS_DIR / version).is_dir():
+        raise ValueError(f"No published model version {version!r}")
+    path = Path(artifacts_dir) / CURRENT_FILE
+    tmp_path = path.with_suffix('.tmp')
+    with open(tmp_path, 'w') as f:
+        f.write(version + '\n')
+    os.replace(tmp_path, path)
+
+
+def prune_versions(artifacts_dir=ARTIFACTS_DIR, keep=KEEP_VERSIONS):
+    """Delete all but the newest keep versions, never the current one"""
+    current = current_version(artifacts_dir)
+    versions = list_versions(artifacts_dir)
+    for version in versions[:max(len(versions) - keep, 0)]:
+        if version != current:
+            shutil.rmtree(Path(artifacts_dir) / VERSIONS_DIR / version)
+
+
+def _files_digest(directory):
+    """SHA-256 of the file names and contents in directory"""
+    digest = hashlib.sha256()
+    for path in sorted(Path(directory).iterdir()):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def publish_version(write_files, artifacts_dir=ARTIFACTS_DIR, keep=KEEP_VERSIONS):
+    """Publish a new version and make it current.
+
+    write_files(directory) writes the artifacts into an empty staging
+    directory. The version is named after the time and a hash of the files,
+    renamed into versions/ and then made current. If a published version
+    already holds identical files (an incremental run with no new rows, or
+    a retrain on unchanged data), that version is made current instead, so
+    a LiveModel has nothing new to reload. Returns the version name.
+    """
+    versions_dir = Path(artifacts_dir) / VERSIONS_DIR
+    versions_dir.mkdir(parents=True, exist_ok=True)
+    staging = versions_dir / f".staging-{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    staging.mkdir()
+    try:
+        write_files(staging)
+        digest = _files_digest(staging)
+        existing = [version for version in list_versions(artifacts_dir)
+                    if version.endswith(f"-{digest[:8]}") and _files_digest(versions_dir / version) == digest]
+        if existing:
+            version = existing[-1]
+            shutil.rmtree(staging)
+        else:
+            version = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%SZ}-{digest[:8]}"
+            os.replace(staging, versions_dir / version)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if version != current_version(artifacts_dir):
+        set_current(artifacts_dir, version)
+    prune_versions(artifacts_dir, keep)
+    return version
+
+
+def load_current_scorer(artifacts_dir=ARTIFACTS_DIR):
+    """load_scorer on the current version"""
+    return load_scorer(resolve_artifacts_dir(artifacts_dir))
+
+
+class LiveModel:
+    """The current scorer, replaced in the background when a new version is published.
+
+    current() returns a (scorer, locations) pair. At most every
+    check_interval seconds it also reads CURRENT; if the version changed it
+    starts a thread that loads the new version and then swaps it in.
+    Callers keep the pair they were handed, so predictions already running
+    finish on the old model and nothing waits for a load. A version that
+    fails to load is recorded in last_error, is not retried, and the old
+    model stays live.
+    """
+
+    def __init__(self, artifacts_dir=ARTIFACTS_DIR, check_interval=CHECK_INTERVAL):
+        self.artifacts_dir = Path(artifacts_dir)
+        self.check_interval = check_interval
+        self.version = current_version(self.artifacts_dir)
+        directory = self.artifacts_dir if self.version is None else self.artifacts_dir / VERSIONS_DIR / self.version
+        self._model = load_scorer(directory)
+        self._lock = threading.Lock()
+        self._loading = None
+        self._failed = None
+        self._next_check = time.monotonic() + check_interval
+        self.reloads = 0
+        self.last_error = None
+
+    def current(self):
+        """(scorer, locations) of the live version"""
+        now = time.monotonic()
+        if now >= self._next_check:
+            self._next_check = now + self.check_interval
+            self.check()
+        return self._model
+
+    def check(self):
+        """Start loading the published version if it differs from the live one"""
+        version = current_version(self.artifacts_dir)
+        with self._lock:
+            if version is None or version in (self.version, self._loading, self._failed):
+                return False
+            self._loading = version
+        threading.Thread(target=self._load, args=(version,), daemon=True).start()
+        return True
+
+    def _load(self, version):
+        try:
+            model = load_scorer(self.artifacts_dir / VERSIONS_DIR / version)
+        except Exception as e:
+            with self._lock:
+                self.last_error = f"{version}: {e}"
+                self._failed = version
+                self._loading = None
+            return
+        with self._lock:
+            self._model = model
+            self.version = version
+            self.reloads += 1
+            self.last_error = None
+            self._loading = None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="List published model versions or change the current one")
+    parser.add_argument('--artifacts', type=Path, default=ARTIFACTS_DIR, help="artifacts directory")
+    parser.add_argument('--activate', metavar='VERSION', help="make VERSION current (e.g. to roll back)")
+    args = parser.parse_args(argv)
+
+    if args.activate:
+        set_current(args.artifacts, args.activate)
+    current = current_version(args.artifacts)
+    for version in list_versions(args.artifacts):
+        print(f"{'*' if version == current else ' '} {version}")
+    if current is None:
+        print(f"No published versions; using the artifacts in {args.artifacts}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Cross-validated comparison of candidate model families.
+
+Every (candidate configuration, CV fold) pair is an independent fit, so the
+whole grid is fanned out over a process pool. Each worker receives the design
+matrix once through the pool initializer rather than with every task.
+"""
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingRegressor
+from sklearn.linear_model import Lasso, LinearRegression, Ridge
+from sklearn.model_selection import ShuffleSplit
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import MaxAbsScaler
+from sklearn.tree import DecisionTreeRegressor
+
+from src.utils.linear_fit import NormalEquationRegression
+
+# (name, estimator, parameter grid)
+CANDIDATES = [
+    ('linear_regression', LinearRegression(), {}),
+    ('lasso', Lasso(max_iter=10000), {'alpha': [0.01, 0.1, 1.0]}),
+    ('ridge', Ridge(), {'alpha': [0.1, 1.0, 10.0]}),
+    ('decision_tree', DecisionTreeRegressor(random_state=0),
+     {'max_depth': [None, 10, 20], 'min_samples_leaf': [1, 5]}),
+    ('gradient_boosting', GradientBoostingRegressor(random_state=0),
+     {'n_estimators': [100, 300], 'max_depth': [3, 5]}),
+]
+# Penalized models fitted on max-abs scaled features
+SCALED_ESTIMATORS = (Lasso, Ridge)
+
+_X = None
+_y = None
+
+
+def expand_candidates(candidates=CANDIDATES, sparse_input=False):
+    """One (name, params, estimator) per point of every parameter grid.
+
+    On sparse input LinearRegression falls back to an lsqr solver that
+    converges poorly here, so it is swapped for NormalEquationRegression.
+    Ridge's sparse solvers stall the same way on unscaled total_sqft, so
+    SCALED_ESTIMATORS are wrapped in a MaxAbsScaler pipeline. MaxAbsScaler
+    keeps CSR input sparse, and scaling dense input too means a grid point
+    scores the same whichever matrix it is given.
+    """
+    configs = []
+    for name, estimator, grid in candidates:
+        if sparse_input and type(estimator) is LinearRegression:
+            estimator = NormalEquationRegression()
+        keys = sorted(grid)
+        for values in itertools.product(*(grid[key] for key in keys)):
+            params = dict(zip(keys, values))
+            configured = clone(estimator).set_params(**params)
+            if isinstance(configured, SCALED_ESTIMATORS):
+                configured = make_pipeline(MaxAbsScaler(), configured)
+            configs.append((name, params, configured))
+    return configs
+
+
+def _init_worker(X, y):
+    global _X, _y
+    _X, _y = X, y
+
+
+def _fit_fold(task):
+    config_id, estimator, train_idx, test_idx = task
+    model = clone(estimator)
+    start = time.perf_counter()
+    model.fit(_X[train_idx], _y[train_idx])
+    fit_time = time.perf_counter() - start
+    return config_id, model.score(_X[test_idx], _y[test_idx]), fit_time
+
+
+def select_model(X, y, candidates=CANDIDATES, n_splits=5, n_jobs=None, random_state=0):
+    """Cross-validate every candidate configuration in parallel.
+
+    X may be dense or CSR. Returns one result dict per configuration, best
+    mean R² first, each with name, params, estimator (unfitted), mean_score,
+    std_score and mean/total fit time.
+    """
+    X = X.to_numpy(dtype=float) if hasattr(X, 'to_numpy') else X
+    y = np.asarray(y, dtype=float)
+    configs = expand_candidates(candidates, sparse_input=not isinstance(X, np.ndarray))
+    cv = ShuffleSplit(n_splits=n_splits, test_size=0.2, random_state=random_state)
+    folds = list(cv.split(np.zeros(len(y))))
+    tasks = [(i, estimator, train_idx, test_idx)
+             for i, (_, _, estimator) in enumerate(configs)
+             for train_idx, test_idx in folds]
+
+    n_jobs = n_jobs or os.cpu_count() or 1
+    scores = [[] for _ in configs]
+    fit_times = [[] for _ in configs]
+    with ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker, initargs=(X, y)) as pool:
+        for config_id, score, fit_time in pool.map(_fit_fold, tasks):
+            scores[config_id].append(score)
+            fit_times[config_id].append(fit_time)
+
+    results = [
+        {
+            'name': name,
+            'params': params,
+            'estimator': estimator,
+            'mean_score': float(np.mean(scores[i])),
+            'std_score': float(np.std(scores[i])),
+            'mean_fit_time': float(np.mean(fit_times[i])),
+            'total_fit_time': float(np.sum(fit_times[i])),
+        }
+        for i, (name, params, estimator) in enumerate(configs)
+    ]
+    return sorted(results, key=lambda result: result['mean_score'], reverse=True)
+
+
+def format_results(results):
+    """Table of per-candidate CV score and fit time"""
+    lines = [f"{'candidate':<20} {'params':<45} {'mean R²':>8} {'std':>7} {'fit s':>8}"]
+    for result in results:
+        params = ', '.join(f"{key}={value}" for key, value in result['params'].items()) or '-'
+        lines.append(f"{result['name']:<20} {params:<45} {result['mean_score']:>8.4f} "
+                     f"{result['std_score']:>7.4f} {result['mean_fit_time']:>8.3f}")
+    return '\n'.join(lines)
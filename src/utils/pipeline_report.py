@@ -0,0 +1,150 @@
+"""Per-stage wall time, memory and row counts for pipeline scripts.
+
+    with PipelineReport('full') as report:
+        with report.stage('read_csv') as stage:
+            df = pd.read_csv(path)
+            stage.rows_out = len(df)
+    report.save(path)
+
+Memory is the process resident set size, sampled every few milliseconds by a
+background thread while the report is open, so allocations made by Arrow
+and BLAS count as well as Python objects. A stage's peak_rss_mb is the
+highest sample taken during it. The report's max_rss_mb is the OS
+high-water mark for the whole process. Outside a `with PipelineReport()`
+block stages are still timed but carry no memory figures.
+"""
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SAMPLE_INTERVAL = 0.005
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+
+def current_rss_mb():
+    """Resident set size now, or None where /proc is unavailable"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * _PAGE_SIZE / 1024**2
+    except OSError:
+        return None
+
+
+def max_rss_mb():
+    """Highest resident set size the process has reached, or None where unsupported"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1024**2 if sys.platform == 'darwin' else peak / 1024
+
+
+class Stage:
+    """One timed step; set rows_in/rows_out and any extra fields while it runs"""
+
+    def __init__(self, name, rows_in=None):
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.extra = {}
+        self.seconds = None
+        self.peak_rss_mb = None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'seconds': self.seconds,
+            'peak_rss_mb': self.peak_rss_mb,
+            'rows_in': self.rows_in,
+            'rows_out': self.rows_out,
+            **self.extra,
+        }
+
+
+class PipelineReport:
+    """Collects Stage records and samples memory while open"""
+
+    def __init__(self, mode=None):
+        self.mode = mode
+        self.stages = []
+        self.summary = {}
+        self.started = None
+        self.seconds = None
+        self._peak = None
+        self._lock = threading.Lock()
+        self._stop = None
+        self._sampler = None
+
+    def __enter__(self):
+        self.started = datetime.now(timezone.utc)
+        self._start_time = time.perf_counter()
+        if current_rss_mb() is not None:
+            self._stop = threading.Event()
+            self._sampler = threading.Thread(target=self._sample, daemon=True)
+            self._sampler.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._start_time
+        if self._sampler is not None:
+            self._stop.set()
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample(self):
+        while not self._stop.wait(SAMPLE_INTERVAL):
+            rss = current_rss_mb()
+            with self._lock:
+                if self._peak is not None and rss > self._peak:
+                    self._peak = rss
+
+    @contextmanager
+    def stage(self, name, rows_in=None):
+        """Time the enclosed block as a named stage"""
+        stage = Stage(name, rows_in)
+        sampling = self._sampler is not None
+        if sampling:
+            with self._lock:
+                self._peak = current_rss_mb()
+        start = time.perf_counter()
+        try:
+            yield stage
+        finally:
+            stage.seconds = time.perf_counter() - start
+            if sampling:
+                with self._lock:
+                    stage.peak_rss_mb = max(self._peak, current_rss_mb())
+            self.stages.append(stage)
+
+    def to_dict(self):
+        return {
+            'mode': self.mode,
+            'started': self.started.isoformat(timespec='seconds') if self.started else None,
+            'seconds': self.seconds,
+            'max_rss_mb': max_rss_mb(),
+            'summary': self.summary,
+            'stages': [stage.to_dict() for stage in self.stages],
+        }
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+    def format(self):
+        """Text table of the stages"""
+        lines = [f"{'stage':28s} {'seconds':>9s} {'peak MB':>9s} {'rows in':>10s} {'rows out':>10s}"]
+        for stage in self.stages:
+            peak = '-' if stage.peak_rss_mb is None else f"{stage.peak_rss_mb:.0f}"
+            rows_in = '-' if stage.rows_in is None else f"{stage.rows_in:,}"
+            rows_out = '-' if stage.rows_out is None else f"{stage.rows_out:,}"
+            lines.append(f"{stage.name:28s} {stage.seconds:9.3f} {peak:>9s} {rows_in:>10s} {rows_out:>10s}")
+        return '\n'.join(lines)
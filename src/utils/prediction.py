@@ -0,0 +1,109 @@
+"""Helpers for loading the trained model and scoring properties."""
+import json
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+ARTIFACTS_DIR = Path(__file__).resolve().parents[1] / "models" / "artifacts"
+
+# Order of the numeric features at the front of columns.json
+NUMERIC_COLUMNS = ['total_sqft', 'bath', 'balcony', 'bhk']
+
+# Columns expected in a batch of properties to score
+INPUT_COLUMNS = ['location', 'sqft', 'bhk', 'bath', 'balcony']
+
+# Rare locations are grouped under 'other' in training and its dummy column is
+# dropped, so it is the baseline with no location column set
+OTHER_LOCATION = 'other'
+
+
+class UnknownLocationError(ValueError):
+    """Raised when a location is not in the model's vocabulary"""
+
+    def __init__(self, locations):
+        self.locations = sorted(set(locations))
+        super().__init__(f"Unknown location(s): {', '.join(self.locations)}")
+
+
+def normalize_location(location):
+    """Normalize a location name the way training does (strip), ignoring case"""
+    return str(location).strip().lower()
+
+
+def build_location_index(data_columns):
+    """Map normalized location names to their column in the feature vector"""
+    location_index = {
+        normalize_location(col): i
+        for i, col in enumerate(data_columns)
+        if i >= len(NUMERIC_COLUMNS)
+    }
+    location_index.setdefault(OTHER_LOCATION, -1)
+    return location_index
+
+
+def resolve_location(location, location_index):
+    """Return the feature column for location, or -1 for the 'other' baseline"""
+    try:
+        return location_index[normalize_location(location)]
+    except KeyError:
+        raise UnknownLocationError([location]) from None
+
+
+def load_artifacts(artifacts_dir=ARTIFACTS_DIR):
+    """Load the trained model, feature columns, location list and location index"""
+    artifacts_dir = Path(artifacts_dir)
+    with open(artifacts_dir / "columns.json", 'r') as f:
+        data_columns = json.load(f)['data_columns']
+        locations = data_columns[len(NUMERIC_COLUMNS):]
+
+    with open(artifacts_dir / "bangalore_home_prices_model.pickle", 'rb') as f:
+        model = pickle.load(f)
+
+    return model, data_columns, locations, build_location_index(data_columns)
+
+
+def resolve_locations(locations, location_index, on_unknown='raise'):
+    """Vectorized resolve_location over a Series of names.
+
+    With on_unknown='raise' any name missing from the index raises
+    UnknownLocationError listing all of them; with 'ignore' unknown names are
+    priced as the 'other' baseline.
+    """
+    normalized = locations.astype(str).str.strip().str.lower()
+    loc_index = normalized.map(location_index)
+    unknown = loc_index.isna()
+    if unknown.any():
+        if on_unknown == 'raise':
+            raise UnknownLocationError(locations[unknown].astype(str))
+        loc_index = loc_index.fillna(-1)
+    return loc_index.to_numpy(dtype=np.int64)
+
+
+def build_sparse_feature_matrix(numeric, loc_index, n_columns):
+    """Build a CSR design matrix from numeric features and location columns.
+
+    numeric is an (n, 4) array in NUMERIC_COLUMNS order and loc_index holds
+    each row's location column, or -1 for the 'other' baseline. Only the
+    numeric values and a single 1 per located row are stored.
+    """
+    # Imported here so dense scoring doesn't pay for loading scipy
+    from scipy import sparse
+
+    numeric = np.asarray(numeric, dtype=float)
+    loc_index = np.asarray(loc_index, dtype=np.int64)
+    n_rows, n_numeric = numeric.shape
+    has_loc = loc_index >= 0
+
+    row_nnz = n_numeric + has_loc.astype(np.int64)
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    np.cumsum(row_nnz, out=indptr[1:])
+
+    data = np.ones(indptr[-1])
+    indices = np.empty(indptr[-1], dtype=np.int64)
+    numeric_pos = indptr[:-1, None] + np.arange(n_numeric)
+    data[numeric_pos] = numeric
+    indices[numeric_pos] = np.arange(n_numeric)
+    indices[indptr[:-1][has_loc] + n_numeric] = loc_index[has_loc]
+
+    return sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_columns))
@@ -0,0 +1,76 @@
+"""Bounded LRU cache of single-property predictions.
+
+Keys are the model's checksum plus the normalized inputs, so a retrained
+model never serves prices from the previous one. The first lookup against a
+new model version drops every cached entry.
+"""
+import threading
+from collections import OrderedDict
+
+from src.utils.prediction import normalize_location
+
+
+class PredictionCache:
+    """Thread-safe LRU cache in front of LinearScorer.predict_one"""
+
+    def __init__(self, maxsize=4096):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get_price(self, scorer, location, sqft, bhk, bath, balcony):
+        """Rounded price (in Lakhs) for a property, computed on a miss"""
+        key = (normalize_location(location), float(sqft), float(bhk), float(bath), float(balcony))
+        version = scorer.checksum
+
+        with self._lock:
+            if version != self._version:
+                if self._version is not None:
+                    self.invalidations += 1
+                self._entries.clear()
+                self._version = version
+            price = self._entries.get(key)
+            if price is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return price
+            self.misses += 1
+
+        # Score outside the lock; unknown locations raise and are not cached
+        price = round(scorer.predict_one(location, sqft, bhk, bath, balcony), 2)
+
+        with self._lock:
+            if version == self._version:
+                self._entries[key] = price
+                self._entries.move_to_end(key)
+                if len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+                    self.evictions += 1
+        return price
+
+    def clear(self):
+        """Drop all entries, keeping the counters"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters for monitoring"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'model_version': self._version,
+            }
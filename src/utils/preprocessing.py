@@ -0,0 +1,151 @@
+"""Cleaning of the raw Bengaluru_House_Data.csv columns.
+
+Shared by the Visualizations page (app.py load_data) and retrain_model.py so
+the two stay in step. Every conversion is a vectorized string/numeric op
+rather than a per-row apply. The string columns repeat a small vocabulary
+(a few thousand distinct sizes, areas and locations however many listings
+there are), so the string work runs once per distinct value and the result
+is broadcast back to the rows.
+
+The outlier filters used for training live here too, so the full and the
+incremental retraining paths apply exactly the same rules.
+"""
+import numpy as np
+import pandas as pd
+
+# Locations with at most this many listings are merged into 'other' for training
+RARE_LOCATION_MAX = 10
+
+# Column types of Bengaluru_House_Data.csv, fixed so every chunk of a chunked
+# read parses the same way a whole-file read does
+CSV_DTYPES = {
+    'area_type': str, 'availability': str, 'location': str, 'size': str, 'society': str,
+    'total_sqft': str, 'bath': float, 'balcony': float, 'price': float,
+}
+
+
+def _map_distinct(values, convert):
+    """Apply a vectorized convert to the distinct values and broadcast back"""
+    codes, uniques = pd.factorize(values)
+    converted = convert(pd.Series(uniques, dtype=values.dtype)).to_numpy()
+    result = pd.Series(converted.take(codes), index=values.index, name=values.name)
+    return result.mask(codes < 0)
+
+
+def _parse_bhk(size):
+    return pd.to_numeric(size.str.split(n=1).str[0], errors='coerce').astype(float)
+
+
+def parse_bhk(size):
+    """Number of bedrooms from the size column ('2 BHK', '4 Bedroom', ...).
+
+    Values that are missing or don't start with a number give 0.
+    """
+    return _map_distinct(size, _parse_bhk).fillna(0).astype(np.int64)
+
+
+def _convert_sqft_to_num(text):
+    parts = text.str.split('-')
+    n_parts = parts.str.len()
+
+    single = pd.to_numeric(text.where(n_parts == 1), errors='coerce')
+    low = pd.to_numeric(parts.str[0].where(n_parts == 2), errors='coerce')
+    high = pd.to_numeric(parts.str[1].where(n_parts == 2), errors='coerce')
+
+    return single.fillna((low + high) / 2).astype(float)
+
+
+def convert_sqft_to_num(total_sqft):
+    """Numeric total_sqft, averaging ranges like '1133 - 1384'.
+
+    Values in other units ('34.46Sq. Meter', '3Cents', ...) become NaN.
+    """
+    if pd.api.types.is_numeric_dtype(total_sqft):
+        return total_sqft.astype(float)
+    return _map_distinct(total_sqft.astype('str'), _convert_sqft_to_num).astype(float)
+
+
+def clean_locations(location):
+    """Strip surrounding whitespace from location names"""
+    return _map_distinct(location, lambda names: names.str.strip())
+
+
+def clean_listings(df):
+    """Add bhk and price_per_sqft and normalize total_sqft and location.
+
+    Rows are not dropped; callers decide how to treat missing values.
+    """
+    df = df.copy()
+    df['bhk'] = parse_bhk(df['size'])
+    df['total_sqft'] = convert_sqft_to_num(df['total_sqft'])
+    df['price_per_sqft'] = df['price'] * 100000 / df['total_sqft']
+    df['location'] = clean_locations(df['location'])
+    return df
+
+
+def group_stats(keys, values):
+    """Mean, population std and size of values for each distinct key.
+
+    Returns (codes, uniques, mean, std, count) where codes maps each row to its
+    group and count includes rows whose value is NaN. Rows are sorted into
+    groups once and each group is reduced as a contiguous slice with numpy's
+    pairwise sum, skipping NaNs the way Series.mean/std do, so the statistics
+    match np.mean/np.std on each group's Series bit for bit. pandas' groupby
+    mean/std round differently, which flips rows lying exactly on mean ± std
+    (every location with two listings, for example).
+    """
+    codes, uniques = pd.factorize(keys)
+    values = np.asarray(values, dtype=float)
+    order = np.argsort(codes, kind='stable')
+    sorted_values = values[order]
+    missing = np.isnan(sorted_values)
+    filled = np.where(missing, 0.0, sorted_values)
+    count = np.bincount(codes, minlength=len(uniques))
+    bounds = np.r_[0, np.cumsum(count)]
+
+    mean = np.full(len(uniques), np.nan)
+    std = np.full(len(uniques), np.nan)
+    for i in range(len(uniques)):
+        start, stop = bounds[i], bounds[i + 1]
+        n_valid = stop - start - missing[start:stop].sum()
+        if n_valid == 0:
+            continue
+        group = filled[start:stop]
+        mean[i] = group.sum() / n_valid
+        dev = np.where(missing[start:stop], 0.0, group - mean[i])
+        std[i] = np.sqrt((dev * dev).sum() / n_valid)
+    return codes, uniques, mean, std, count
+
+
+def remove_pps_outliers(df):
+    """Keep rows within one std of their location's mean price per sqft.
+
+    Rows come back grouped by location, in the order the original
+    per-location loop produced.
+    """
+    codes, _, mean, std, _ = group_stats(df.location, df.price_per_sqft)
+    m = mean[codes]
+    st = std[codes]
+    keep = (df.price_per_sqft > (m - st)) & (df.price_per_sqft <= (m + st))
+    return df[keep].sort_values('location', kind='stable').reset_index(drop=True)
+
+
+def remove_bhk_outliers(df):
+    """Drop n-BHK rows cheaper per sqft than the mean (n-1)-BHK row of the same
+    location, when that location has more than 5 (n-1)-BHK rows
+    """
+    _, groups, mean, _, count = group_stats(pd.MultiIndex.from_arrays([df.location, df.bhk]), df.price_per_sqft)
+    prev = groups.get_indexer(pd.MultiIndex.from_arrays([df.location, df.bhk - 1]))
+    has_prev = prev >= 0
+    exclude = has_prev & (count[prev] > 5) & (df.price_per_sqft.to_numpy() < mean[prev])
+    return df[~exclude]
+
+
+def remove_outliers(df):
+    """Drop price per sqft, BHK and bathroom outliers before training.
+
+    Every statistic is taken within a location, so filtering a subset of
+    locations gives exactly the rows a pass over the whole frame would keep.
+    """
+    df = remove_bhk_outliers(remove_pps_outliers(df))
+    return df[df.bath < df.bhk + 2]
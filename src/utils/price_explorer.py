@@ -0,0 +1,69 @@
+"""Price many variations of a property in one scoring pass.
+
+price_grid prices every combination of square footage, BHK and bathroom
+count for one location. rank_locations prices one property in every
+location the model knows. Either way the inputs are laid out as arrays and
+sent through scorer.predict once, so thousands of prices cost one
+vectorized evaluation rather than thousands of predict_one calls.
+"""
+import numpy as np
+
+from src.utils.prediction import NUMERIC_COLUMNS, resolve_location
+
+WHAT_IF_SQFT = np.arange(300, 5001, 50)
+WHAT_IF_BHK = np.arange(1, 6)
+WHAT_IF_BATH = np.arange(1, 6)
+
+
+def price_grid(scorer, location, balcony, sqft=WHAT_IF_SQFT, bhk=WHAT_IF_BHK, bath=WHAT_IF_BATH):
+    """Prices (in Lakhs) indexed [bhk, bath, sqft] for one location.
+
+    Raises UnknownLocationError if the location is not in the model.
+    """
+    loc_index = resolve_location(location, scorer.location_index)
+    bhk_grid, bath_grid, sqft_grid = np.meshgrid(bhk, bath, sqft, indexing='ij')
+    prices = scorer.predict(
+        np.full(sqft_grid.size, loc_index), sqft_grid.ravel(), bhk_grid.ravel(),
+        bath_grid.ravel(), np.full(sqft_grid.size, balcony),
+    )
+    return prices.reshape(sqft_grid.shape)
+
+
+class LocationRanking:
+    """Locations sorted by price for one property, cheapest first"""
+
+    def __init__(self, data_columns, loc_index, prices):
+        self._data_columns = data_columns
+        self.loc_index = loc_index
+        self.prices = prices
+
+    def __len__(self):
+        return len(self.prices)
+
+    def _pairs(self, positions):
+        return [(self._data_columns[self.loc_index[i]], float(self.prices[i])) for i in positions]
+
+    def cheapest(self, n):
+        """The n cheapest (location, price) pairs"""
+        return self._pairs(range(min(n, len(self))))
+
+    def priciest(self, n):
+        """The n most expensive (location, price) pairs, most expensive first"""
+        return self._pairs(range(len(self) - 1, max(len(self) - n, 0) - 1, -1))
+
+
+def rank_locations(scorer, sqft, bhk, bath, balcony, max_price=None):
+    """Price one property in every location and sort by price.
+
+    Locations priced above max_price (in Lakhs) are left out. Only the
+    pairs asked for from the returned LocationRanking are turned into
+    Python objects, so the cost stays in numpy however many locations
+    the model has.
+    """
+    loc_index = np.arange(len(NUMERIC_COLUMNS), len(scorer.data_columns))
+    n = len(loc_index)
+    prices = scorer.predict(loc_index, np.full(n, sqft), np.full(n, bhk), np.full(n, bath), np.full(n, balcony))
+    order = np.argsort(prices)
+    if max_price is not None:
+        order = order[:np.searchsorted(prices[order], max_price, side='right')]
+    return LocationRanking(scorer.data_columns, loc_index[order], prices[order])
@@ -1,109 +1,256 @@
+import argparse
+import sys
 import numpy as np
 import pandas as pd
 import pickle
 import json
+from pathlib import Path
+from sklearn.base import clone
 from sklearn.model_selection import train_test_split
 from sklearn.linear_model import LinearRegression
+from sklearn.pipeline import Pipeline
 
-print("Loading and preprocessing data...")
-
-# Load data
-df1 = pd.read_csv("../../data/Bengaluru_House_Data.csv")
-
-# Data cleaning and preprocessing
-df2 = df1.drop(['area_type','availability','society'], axis='columns')
-df3 = df2.dropna()
-df3['bhk'] = df3['size'].apply(lambda x: int(x.split()[0]))
-
-# Convert sqft to numeric
-def convert_sqft_to_num(x):
-    tokens = x.split('-')
-    if len(tokens) == 2:
-        return ((float(tokens[0])+float(tokens[1]))/2)
-    try:
-        return float(x)
-    except:
-        return None
-
-df4 = df3.copy()
-df4['total_sqft'] = df4['total_sqft'].apply(convert_sqft_to_num)
-
-# Create price per sqft
-df5 = df4.copy()
-df5['price_per_sqft'] = df5['price']*100000/df5['total_sqft']
-
-# Reduce locations
-df5.location = df5.location.apply(lambda x: x.strip())
-location_stats = df5.groupby('location')['location'].agg('count').sort_values(ascending=False)
-location_stats_less_than_10 = location_stats[location_stats<=10]
-df5.location = df5.location.apply(lambda x: 'other' if x in location_stats_less_than_10 else x)
-
-# Remove outliers
-df6 = df5[~((df5.total_sqft/df5.bhk)<300)]
-
-def remove_pps_outliers(df):
-    df_out = pd.DataFrame()
-    for key,subdf in df.groupby('location'):
-        m = np.mean(subdf.price_per_sqft)
-        st = np.std(subdf.price_per_sqft)
-        reduced_df = subdf[(subdf.price_per_sqft>(m-st)) & (subdf.price_per_sqft<=(m+st))]
-        df_out = pd.concat([df_out,reduced_df], ignore_index=True)
-    return df_out
-
-df7 = remove_pps_outliers(df6)
-
-def remove_bhk_outliers(df):
-    exclude_indices = np.array([])
-    for location, location_df in df.groupby('location'):
-        bhk_stats = {}
-        for bhk, bhk_df in location_df.groupby('bhk'):
-            bhk_stats[bhk] = {
-                'mean': np.mean(bhk_df.price_per_sqft),
-                'std': np.std(bhk_df.price_per_sqft),
-                'count': bhk_df.shape[0]
-            }
-        for bhk, bhk_df in location_df.groupby('bhk'):
-            stats = bhk_stats.get(bhk-1)
-            if stats and stats['count']>5:
-                exclude_indices = np.append(exclude_indices, bhk_df[bhk_df.price_per_sqft<(stats['mean'])].index.values)
-    return df.drop(exclude_indices, axis='index')
-
-df8 = remove_bhk_outliers(df7)
-df9 = df8[df8.bath < df8.bhk+2]
-
-# Drop unnecessary columns
-df10 = df9.drop(['size','price_per_sqft'], axis='columns')
-
-# Create dummy variables
-dummies = pd.get_dummies(df10.location)
-df11 = pd.concat([df10, dummies.drop('other', axis='columns')], axis='columns')
-df12 = df11.drop('location', axis='columns')
-
-# Prepare X and y
-X = df12.drop('price', axis='columns')
-y = df12.price
-
-print(f"Training model with {X.shape[0]} samples and {X.shape[1]} features...")
-
-# Train model
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=10)
-lr_clf = LinearRegression()
-lr_clf.fit(X_train, y_train)
-score = lr_clf.score(X_test, y_test)
-
-print(f"Model R² score: {score:.4f}")
-
-# Save model
-print("Saving model to artifacts folder...")
-with open('../models/artifacts/bangalore_home_prices_model.pickle', 'wb') as f:
-    pickle.dump(lr_clf, f)
-
-# Save columns
-columns = {
-    'data_columns': [col.lower() for col in X.columns]
-}
-with open('../models/artifacts/columns.json', 'w') as f:
-    f.write(json.dumps(columns))
-
-print("Model and columns saved successfully!")
-print(f"Total locations: {len([col for col in X.columns if col not in ['total_sqft', 'bath', 'balcony', 'bhk']])}")
+ROOT_DIR = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT_DIR))
+
+from src.utils.linear_fit import NormalEquationRegression, to_linear_regression
+from src.utils.model_registry import current_version, publish_version
+from src.utils.model_selection import format_results, select_model
+from src.utils.prediction import ARTIFACTS_DIR, NUMERIC_COLUMNS, build_sparse_feature_matrix
+from src.utils.incremental_training import STATE_PATH, TrainingState
+from src.utils.pipeline_report import PipelineReport
+from src.utils.preprocessing import RARE_LOCATION_MAX, clean_listings, remove_bhk_outliers, remove_pps_outliers
+from src.utils.scoring import MODEL_FILE, LinearScorer
+from src.utils.streaming_training import DEFAULT_CHUNKSIZE, fit_streaming
+
+DATA_PATH = ROOT_DIR / "data" / "Bengaluru_House_Data.csv"
+REPORT_FILE = 'retrain_report.json'
+
+def clean_training_listings(df1, report=None):
+    """Clean raw listings, merge rare locations into 'other' and drop implausibly small homes"""
+    report = report or PipelineReport()
+
+    # Data cleaning and preprocessing
+    with report.stage('drop_missing', rows_in=len(df1)) as stage:
+        df2 = df1.drop(['area_type','availability','society'], axis='columns')
+        df3 = df2.dropna()
+        stage.rows_out = len(df3)
+
+    # Add bhk and price per sqft, convert sqft to numeric and strip locations
+    with report.stage('clean_listings', rows_in=len(df3)) as stage:
+        df5 = clean_listings(df3)
+        stage.rows_out = len(df5)
+
+    # Reduce locations
+    with report.stage('reduce_locations', rows_in=len(df5)) as stage:
+        location_stats = df5.groupby('location')['location'].agg('count').sort_values(ascending=False)
+        location_stats_less_than_10 = location_stats[location_stats<=RARE_LOCATION_MAX]
+        df5.location = df5.location.apply(lambda x: 'other' if x in location_stats_less_than_10 else x)
+        stage.rows_out = len(df5)
+        stage.extra['locations'] = df5.location.nunique()
+
+    # Drop listings with under 300 sqft per bedroom
+    with report.stage('filter_sqft_per_bhk', rows_in=len(df5)) as stage:
+        df6 = df5[~((df5.total_sqft/df5.bhk)<300)]
+        stage.rows_out = len(df6)
+    return df6
+
+def prepare_training_frame(df1, report=None):
+    """Clean raw listings and drop outliers, leaving location, the numeric features and price"""
+    report = report or PipelineReport()
+    df6 = clean_training_listings(df1, report)
+
+    # Remove outliers
+    with report.stage('remove_pps_outliers', rows_in=len(df6)) as stage:
+        df7 = remove_pps_outliers(df6)
+        stage.rows_out = len(df7)
+    with report.stage('remove_bhk_outliers', rows_in=len(df7)) as stage:
+        df8 = remove_bhk_outliers(df7)
+        stage.rows_out = len(df8)
+    with report.stage('filter_bath', rows_in=len(df8)) as stage:
+        df9 = df8[df8.bath < df8.bhk+2]
+        stage.rows_out = len(df9)
+
+    # Drop unnecessary columns
+    return df9.drop(['size','price_per_sqft'], axis='columns')
+
+def sparse_design_matrix(df10):
+    """CSR one-hot design matrix with the get_dummies columns (sorted locations, 'other' dropped)"""
+    location_names = sorted(set(df10.location) - {'other'})
+    loc_index = pd.Index(location_names).get_indexer(df10.location).astype(np.int64)
+    loc_index[loc_index >= 0] += len(NUMERIC_COLUMNS)
+    feature_names = NUMERIC_COLUMNS + location_names
+    X = build_sparse_feature_matrix(df10[NUMERIC_COLUMNS].to_numpy(dtype=float), loc_index, len(feature_names))
+    return X, feature_names
+
+def write_artifacts(clf, feature_names, artifacts_dir):
+    """Write the pickle, columns.json and, for linear models, the compact JSON model"""
+    with open(artifacts_dir / 'bangalore_home_prices_model.pickle', 'wb') as f:
+        pickle.dump(clf, f)
+
+    # Save columns
+    columns = {
+        'data_columns': [col.lower() for col in feature_names]
+    }
+    with open(artifacts_dir / 'columns.json', 'w') as f:
+        f.write(json.dumps(columns))
+
+    # Export the compact model that loads without sklearn; only linear models have one
+    if hasattr(clf, 'coef_'):
+        LinearScorer.from_model(clf, columns['data_columns']).save(artifacts_dir / MODEL_FILE)
+
+def save_artifacts(clf, feature_names, report=None):
+    """Publish the model as a new version in the artifacts registry and make it current"""
+    report = report or PipelineReport()
+    print("Saving model to artifacts folder...")
+    previous = current_version(ARTIFACTS_DIR)
+    with report.stage('save_artifacts') as stage:
+        version = publish_version(lambda directory: write_artifacts(clf, feature_names, directory), ARTIFACTS_DIR)
+        stage.extra.update(version=version, unchanged=version == previous)
+
+    if version == previous:
+        print(f"Model unchanged; version {version} stays current")
+    else:
+        print(f"Model and columns saved as version {version}")
+    print(f"Total locations: {len([col for col in feature_names if col not in NUMERIC_COLUMNS])}")
+
+def retrain_incremental(report, state_path=STATE_PATH):
+    """Fold rows appended to the CSV since the last run into the saved statistics and refit"""
+    print("Loading training state...")
+    with report.stage('load_state') as stage:
+        state = TrainingState.load(state_path) if state_path.exists() else TrainingState()
+        stage.rows_out = len(state.rows)
+    with report.stage('read_new_rows') as stage:
+        n_new = state.update(DATA_PATH)
+        stage.rows_out = n_new
+    with report.stage('fit') as stage:
+        clf, feature_names = state.fit()
+        stage.rows_out = state.n_samples
+    print(f"Processed {n_new} new rows")
+    print(f"Fit on all {state.n_samples} retained rows (no holdout split)")
+    with report.stage('save_state'):
+        state.save(state_path)
+    report.summary.update(new_rows=n_new, samples=state.n_samples, features=len(feature_names))
+    save_artifacts(clf, feature_names, report)
+
+def retrain_streaming(report, chunksize=DEFAULT_CHUNKSIZE):
+    """Fit from the CSV in chunks, keeping only per-location statistics in memory"""
+    print(f"Streaming data in chunks of {chunksize} rows...")
+    with report.stage('stream_fit') as stage:
+        clf, feature_names, n_samples = fit_streaming(DATA_PATH, chunksize)
+        stage.rows_out = n_samples
+    print(f"Fit on all {n_samples} retained rows (no holdout split)")
+    report.summary.update(samples=n_samples, features=len(feature_names), chunksize=chunksize)
+    save_artifacts(clf, feature_names, report)
+
+def retrain_full(args, report):
+    """Read, clean and filter the whole CSV, then fit on a train/test split"""
+    print("Loading and preprocessing data...")
+
+    # Load data
+    with report.stage('read_csv') as stage:
+        df1 = pd.read_csv(DATA_PATH)
+        stage.rows_out = len(df1)
+    df10 = prepare_training_frame(df1, report)
+
+    # Create dummy variables
+    with report.stage('design_matrix', rows_in=len(df10)) as stage:
+        if args.sparse:
+            X, feature_names = sparse_design_matrix(df10)
+            y = df10.price
+            x_bytes = X.data.nbytes + X.indices.nbytes + X.indptr.nbytes
+        else:
+            dummies = pd.get_dummies(df10.location)
+            df11 = pd.concat([df10, dummies.drop('other', axis='columns')], axis='columns')
+            df12 = df11.drop('location', axis='columns')
+
+            # Prepare X and y
+            X = df12.drop('price', axis='columns')
+            y = df12.price
+            feature_names = list(X.columns)
+            x_bytes = X.memory_usage(deep=True).sum()
+        stage.rows_out = X.shape[0]
+        stage.extra.update(features=X.shape[1], matrix_mb=x_bytes / 1024**2)
+
+    print(f"Training model with {X.shape[0]} samples and {X.shape[1]} features...")
+    print(f"{'Sparse' if args.sparse else 'Dense'} design matrix: {x_bytes / 1024**2:.2f} MB")
+
+    # Select model family
+    with report.stage('train_test_split', rows_in=X.shape[0]) as stage:
+        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=10)
+        stage.rows_out = X_train.shape[0]
+    if args.select_model:
+        print(f"Cross-validating candidates ({args.cv_folds} folds)...")
+        # Only the training rows, so the held-out score stays unbiased
+        with report.stage('select_model', rows_in=X_train.shape[0]) as stage:
+            results = select_model(X_train, y_train, n_splits=args.cv_folds, n_jobs=args.jobs)
+            best = results[0]
+            stage.extra.update(candidates=len(results), selected=best['name'], params=best['params'])
+        print(format_results(results))
+        print(f"Selected {best['name']} {best['params']}")
+        clf = clone(best['estimator'])
+    elif args.sparse:
+        # LinearRegression's sparse lsqr solver converges poorly on these
+        # features, so solve the normal equations instead
+        clf = NormalEquationRegression()
+    else:
+        clf = LinearRegression()
+
+    # Train model
+    with report.stage('fit', rows_in=X_train.shape[0]) as stage:
+        clf.fit(X_train, y_train)
+        stage.extra['estimator'] = type(clf[-1] if isinstance(clf, Pipeline) else clf).__name__
+    with report.stage('score', rows_in=X_test.shape[0]):
+        score = clf.score(X_test, y_test)
+    if isinstance(clf, NormalEquationRegression):
+        clf = to_linear_regression(clf.intercept_, clf.coef_)
+    elif isinstance(clf, Pipeline):
+        # Fold the selected MaxAbsScaler into the coefficients so the compact model still exports
+        scaler, estimator = clf[0], clf[-1]
+        clf = to_linear_regression(estimator.intercept_, estimator.coef_ / scaler.scale_)
+
+    print(f"Model R² score: {score:.4f}")
+    report.summary.update(samples=X.shape[0], features=X.shape[1], r2=score,
+                          select_model=args.select_model)
+    save_artifacts(clf, feature_names, report)
+
+def main():
+    parser = argparse.ArgumentParser(description="Retrain the Bangalore house price model")
+    parser.add_argument('--sparse', action='store_true',
+                        help="one-hot encode locations into a CSR matrix instead of a dense frame")
+    parser.add_argument('--select-model', action='store_true',
+                        help="cross-validate candidate model families in parallel and keep the best")
+    parser.add_argument('--cv-folds', type=int, default=5, help="shuffle-split folds for --select-model")
+    parser.add_argument('--jobs', type=int, default=None,
+                        help="worker processes for --select-model (default: all CPUs)")
+    parser.add_argument('--incremental', action='store_true',
+                        help="process only rows appended since the last --incremental run")
+    parser.add_argument('--stream', action='store_true',
+                        help="read the CSV in chunks so memory does not grow with the file")
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE, help="rows per chunk for --stream")
+    args = parser.parse_args()
+
+    if (args.incremental or args.stream) and (args.sparse or args.select_model or (args.incremental and args.stream)):
+        parser.error("--incremental and --stream cannot be combined with each other, --sparse or --select-model")
+
+    if args.incremental:
+        mode = 'incremental'
+    elif args.stream:
+        mode = 'stream'
+    else:
+        mode = 'sparse' if args.sparse else 'dense'
+    with PipelineReport(mode) as report:
+        if args.incremental:
+            retrain_incremental(report)
+        elif args.stream:
+            retrain_streaming(report, args.chunksize)
+        else:
+            retrain_full(args, report)
+
+    # Per-stage timing, memory and row counts
+    report.save(ARTIFACTS_DIR / REPORT_FILE)
+    print(report.format())
+    print(f"Total time: {report.seconds:.2f}s; stage report saved to {ARTIFACTS_DIR / REPORT_FILE}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""Bounded-memory training over a listings CSV read in chunks.
+
+retrain_model.py normally holds the whole file, and several filtered copies
+of it, in memory. fit_streaming instead reads the CSV in chunks and cleans
+each one, keeping only per-location aggregates between chunks. Each outlier
+filter needs statistics of the rows that survive the previous one, so the
+file is read three times:
+
+1. listing counts per location (which decide the merge into 'other') and
+   price per sqft count/mean/M2 per location;
+2. price per sqft count and sum per (location, bhk) over the rows the price
+   per sqft filter keeps;
+3. the filters themselves, with every surviving row folded into its
+   location's normal-equation sums.
+
+Memory is one chunk plus a few numbers per location, whatever the file
+size. The statistics are pooled across chunks rather than taken over each
+whole group at once. A row lying exactly on a filter boundary can therefore
+come out differently from the in-memory filters, which round differently.
+"""
+import numpy as np
+import pandas as pd
+
+from src.utils.incremental_training import combine_location_equations, equations_by_location
+from src.utils.linear_fit import to_linear_regression
+from src.utils.prediction import OTHER_LOCATION
+from src.utils.preprocessing import CSV_DTYPES, RARE_LOCATION_MAX, clean_listings
+
+DEFAULT_CHUNKSIZE = 100_000
+
+
+def read_listing_chunks(csv_path, chunksize=DEFAULT_CHUNKSIZE):
+    """Cleaned chunks of the listings CSV, before any training filter"""
+    for raw in pd.read_csv(csv_path, chunksize=chunksize, dtype=CSV_DTYPES):
+        yield clean_listings(raw.drop(['area_type', 'availability', 'society'], axis='columns').dropna())
+
+
+def combine_moments(moments, keys):
+    """Pool (n, mean, m2) rows sharing a key into one row per key.
+
+    m2 is the sum of squared deviations from the mean, so pooled groups
+    keep their spread without revisiting any values.
+    """
+    n = moments['n'].groupby(keys).sum()
+    mean = (moments['n'] * moments['mean']).groupby(keys).sum() / n
+    dev = moments['mean'].to_numpy() - mean.reindex(keys).to_numpy()
+    m2 = (moments['m2'] + moments['n'] * dev ** 2).groupby(keys).sum()
+    return pd.DataFrame({'n': n, 'mean': mean, 'm2': m2})
+
+
+def _pps_moments(df):
+    grouped = df.dropna(subset=['price_per_sqft']).groupby('location')['price_per_sqft']
+    n = grouped.count()
+    return pd.DataFrame({'n': n, 'mean': grouped.mean(), 'm2': grouped.var(ddof=0) * n})
+
+
+def _reduce_locations(location, counts):
+    rare = counts.reindex(location).to_numpy() <= RARE_LOCATION_MAX
+    return location.mask(rare, OTHER_LOCATION)
+
+
+def _keep_pps(df, pps_stats):
+    mean = pps_stats['mean'].reindex(df['location']).to_numpy()
+    std = np.sqrt(pps_stats['m2'] / pps_stats['n']).reindex(df['location']).to_numpy()
+    return df[(df.price_per_sqft > (mean - std)) & (df.price_per_sqft <= (mean + std))]
+
+
+def _drop_bhk_outliers(df, bhk_stats):
+    prev = pd.MultiIndex.from_arrays([df['location'], df['bhk'] - 1])
+    count = bhk_stats['n'].reindex(prev, fill_value=0).to_numpy()
+    mean = (bhk_stats['sum'] / bhk_stats['n']).reindex(prev).to_numpy()
+    return df[~((count > 5) & (df.price_per_sqft.to_numpy() < mean))]
+
+
+def fit_streaming(csv_path, chunksize=DEFAULT_CHUNKSIZE):
+    """Fit the price model on csv_path, reading chunksize rows at a time.
+
+    Applies the same cleaning, location merge and outlier filters as
+    retrain_model.py and fits on every retained row (no holdout split).
+    Returns (model, feature_names, n_samples).
+    """
+    # Pass 1: listing counts and price per sqft moments per raw location
+    counts = pd.Series(dtype='int64')
+    pps_moments = None
+    for df in read_listing_chunks(csv_path, chunksize):
+        counts = counts.add(df['location'].value_counts(), fill_value=0)
+        chunk_moments = _pps_moments(df[~((df.total_sqft / df.bhk) < 300)])
+        if pps_moments is not None:
+            chunk_moments = pd.concat([pps_moments, chunk_moments])
+        pps_moments = combine_moments(chunk_moments, chunk_moments.index)
+    reduced = _reduce_locations(pps_moments.index.to_series(), counts)
+    pps_stats = combine_moments(pps_moments, reduced.to_numpy())
+
+    def filtered_chunks():
+        for df in read_listing_chunks(csv_path, chunksize):
+            df = df[~((df.total_sqft / df.bhk) < 300)]
+            yield _keep_pps(df.assign(location=_reduce_locations(df['location'], counts)), pps_stats)
+
+    # Pass 2: per (location, bhk) price per sqft sums over the rows pass 1 keeps
+    bhk_stats = None
+    for df in filtered_chunks():
+        grouped = df.groupby(['location', 'bhk'])['price_per_sqft'].agg(n='count', sum='sum')
+        bhk_stats = grouped if bhk_stats is None else bhk_stats.add(grouped, fill_value=0)
+
+    # Pass 3: filter and accumulate the normal equations per location
+    location_equations = {}
+    for df in filtered_chunks():
+        df = _drop_bhk_outliers(df, bhk_stats)
+        df = df[df.bath < df.bhk + 2]
+        for name, eq in equations_by_location(df).items():
+            if name in location_equations:
+                location_equations[name].merge(eq)
+            else:
+                location_equations[name] = eq
+
+    equations, feature_names = combine_location_equations(location_equations)
+    return to_linear_regression(*equations.solve()), feature_names, equations.n_samples
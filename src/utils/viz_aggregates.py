@@ -0,0 +1,73 @@
+"""Pre-aggregated tables for the Visualizations tabs.
+
+build_aggregates scans the cleaned dataset once and keeps only what the tabs
+draw: the 2/3 BHK points for each of the most common locations, the price per
+sqft histogram and summary statistics, and the bathroom counts. The app builds
+it once per dataset version, so widget interactions only index into these
+small tables.
+
+Every table is bounded whatever the dataset size: the histogram is binned
+here rather than in the browser, and a location/BHK group with more than
+max_points listings keeps a uniform random sample of max_points of them
+(the full count is kept in bhk_counts for labelling).
+"""
+import numpy as np
+import pandas as pd
+
+TOP_LOCATIONS = 20
+COMPARISON_BHK = (2, 3)
+PPS_QUANTILE = 0.95
+PPS_BINS = 50
+MAX_SCATTER_POINTS = 2000
+
+
+def build_aggregates(df, max_points=MAX_SCATTER_POINTS, seed=0):
+    """Prepare the tables every Visualizations tab renders from"""
+    top_locations = df['location'].value_counts().head(TOP_LOCATIONS).index.tolist()
+
+    comparison = df.loc[
+        df['location'].isin(top_locations) & df['bhk'].isin(COMPARISON_BHK),
+        ['location', 'bhk', 'total_sqft', 'price'],
+    ]
+    bhk_points = {}
+    bhk_counts = {}
+    for key, group in comparison.groupby(['location', 'bhk']):
+        bhk_counts[key] = len(group)
+        if len(group) > max_points:
+            group = group.sample(n=max_points, random_state=seed)
+        bhk_points[key] = group[['total_sqft', 'price']].reset_index(drop=True)
+
+    pps = df['price_per_sqft']
+    pps_filtered = pps[pps < pps.quantile(PPS_QUANTILE)].to_numpy()
+    counts, edges = np.histogram(pps_filtered, bins=PPS_BINS)
+    pps_histogram = pd.DataFrame({
+        'bin_start': edges[:-1],
+        'bin_end': edges[1:],
+        'count': counts,
+    })
+
+    return {
+        'top_locations': top_locations,
+        'bhk_points': bhk_points,
+        'bhk_counts': bhk_counts,
+        'pps_histogram': pps_histogram,
+        'pps_summary': {
+            'mean': pps.mean(),
+            'median': pps.median(),
+            'std': pps.std(),
+        },
+        'bath_counts': df['bath'].value_counts().sort_index(),
+    }
+
+
+def get_bhk_points(aggregates, location, bhk):
+    """(total_sqft, price) points for one location and BHK, empty if none"""
+    points = aggregates['bhk_points'].get((location, bhk))
+    if points is None:
+        return pd.DataFrame({'total_sqft': [], 'price': []})
+    return points
+
+
+def get_bhk_count(aggregates, location, bhk):
+    """Listings for one location and BHK before any downsampling"""
+    return aggregates['bhk_counts'].get((location, bhk), 0)